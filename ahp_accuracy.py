@@ -0,0 +1,152 @@
+import argparse
+
+import numpy as np
+
+from ahp_func import RI_VALUES, ReciprocalMatrix, determine_consistency, normalize_and_calculate_weights
+
+# Saaty scale judgments used for random matrices (1/9 ... 9)
+SAATY_SCALE = np.array([1 / 9, 1 / 8, 1 / 7, 1 / 6, 1 / 5, 1 / 4, 1 / 3, 1 / 2, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+# Acceptable Consistency Ratio
+CR_THRESHOLD = 0.1
+
+def exact_column_weights(matrices):
+    """Column-normalized weights without the 1e-10 epsilon, to isolate its effect."""
+    return np.mean(matrices / np.sum(matrices, axis=-2, keepdims=True), axis=-1)
+
+# Weight solvers under test: each maps a (count, n, n) stack to (count, n) weights
+SOLVERS = {
+    "arithmetic": normalize_and_calculate_weights,
+    "no epsilon": exact_column_weights,
+    "packed": lambda matrices: ReciprocalMatrix.from_dense(matrices).weights(),
+}
+
+# Smallest weight drawn for skewed corpora; keeps w_i / w_j finite in float64
+MIN_WEIGHT = 1e-12
+
+def reciprocal_from_upper(upper, n):
+    """Build a (count, n, n) stack of reciprocal matrices from (count, n(n-1)/2) upper-triangle judgments."""
+    rows, cols = np.triu_indices(n, k=1)
+    matrices = np.ones((len(upper), n, n))
+    matrices[:, rows, cols] = upper
+    matrices[:, cols, rows] = 1 / upper
+    return matrices
+
+def random_matrices(count, n, rng):
+    """Random reciprocal matrices with judgments drawn uniformly from the Saaty scale."""
+    upper = rng.choice(SAATY_SCALE, size=(count, n * (n - 1) // 2))
+    return reciprocal_from_upper(upper, n)
+
+def near_consistent_matrices(count, n, rng, sigma=0.2, saaty=False, alpha=1.0):
+    """Perturbed consistent matrices w_i / w_j * exp(N(0, sigma)), optionally snapped to the Saaty scale.
+
+    Weights are Dirichlet(alpha); a small alpha (e.g. 0.1) gives extreme and near-zero weights.
+    """
+    weights = np.maximum(rng.dirichlet(np.full(n, alpha), size=count), MIN_WEIGHT)
+    weights /= np.sum(weights, axis=-1, keepdims=True)
+    rows, cols = np.triu_indices(n, k=1)
+    upper = weights[:, rows] / weights[:, cols] * np.exp(rng.normal(0, sigma, (count, len(rows))))
+    if saaty:
+        # Nearest scale value in log space, as an analyst would enter it
+        nearest = np.abs(np.log(upper)[..., None] - np.log(SAATY_SCALE)).argmin(axis=-1)
+        upper = SAATY_SCALE[nearest]
+    return reciprocal_from_upper(upper, n)
+
+def eigen_reference(matrices):
+    """Principal eigenvector weights and Consistency Ratio of a matrix stack via numpy.linalg.eig."""
+    n = matrices.shape[-1]
+    eigenvalues, eigenvectors = np.linalg.eig(matrices)
+    principal = np.argmax(eigenvalues.real, axis=-1)
+    lambda_max = np.take_along_axis(eigenvalues.real, principal[:, None], axis=-1)[:, 0]
+    vectors = np.take_along_axis(eigenvectors.real, principal[:, None, None], axis=-1)[..., 0]
+    # The Perron vector has one sign; dividing by the sum makes it positive and normalized
+    weights = vectors / np.sum(vectors, axis=-1, keepdims=True)
+    cr = (lambda_max - n) / (n - 1) / RI_VALUES[n - 1]
+    return weights, cr
+
+def exact_reference(matrices):
+    """Epsilon-free column-normalized weights and their Consistency Ratio."""
+    weights = exact_column_weights(matrices)
+    return weights, determine_consistency(matrices, weights, RI_VALUES)
+
+# Direct comparisons that isolate one effect: name -> (solver, reference it differs from only by that effect)
+EFFECTS = {
+    "epsilon": (normalize_and_calculate_weights, exact_reference),
+}
+
+def compare(matrices, solver, reference=eigen_reference):
+    """Weight and CR errors of one solver against a reference (the eigenvector by default)."""
+    reference_weights, reference_cr = reference(matrices)
+    weights = solver(matrices)
+    cr = determine_consistency(matrices, weights, RI_VALUES)
+    return {
+        "weight_error": np.max(np.abs(weights - reference_weights), axis=-1),
+        "cr_error": np.abs(cr - reference_cr),
+        "cr": cr,
+        "reference_cr": reference_cr,
+    }
+
+def summarize(errors, band=0.01):
+    """Reduce per-matrix errors to percentiles and threshold misclassification counts."""
+    accepted = errors["cr"] <= CR_THRESHOLD
+    reference_accepted = errors["reference_cr"] <= CR_THRESHOLD
+    percentiles = (50, 90, 99, 100)
+    return {
+        "count": len(accepted),
+        "weight_error": dict(zip(percentiles, np.percentile(errors["weight_error"], percentiles))),
+        "cr_error": dict(zip(percentiles, np.percentile(errors["cr_error"], percentiles))),
+        "false_accept": int(np.count_nonzero(accepted & ~reference_accepted)),
+        "false_reject": int(np.count_nonzero(~accepted & reference_accepted)),
+        "near_threshold": int(np.count_nonzero(np.abs(errors["reference_cr"] - CR_THRESHOLD) < band)),
+    }
+
+def run(sizes=range(3, 11), count=100_000, chunk=20_000, sigma=0.2, seed=0, alpha=0.1):
+    """Evaluate every solver and effect on each corpus and size; returns {(corpus, n, solver): summary}."""
+    rng = np.random.default_rng(seed)
+    corpora = {
+        "random": lambda size, n: random_matrices(size, n, rng),
+        "near-consistent": lambda size, n: near_consistent_matrices(size, n, rng, sigma),
+        "near-consistent (Saaty)": lambda size, n: near_consistent_matrices(size, n, rng, sigma, saaty=True),
+        "skewed weights": lambda size, n: near_consistent_matrices(size, n, rng, sigma, alpha=alpha),
+    }
+    results = {}
+    for corpus, generate in corpora.items():
+        for n in sizes:
+            # Generate in chunks so eig never holds more than chunk matrices at once
+            collected = {name: [] for name in [*SOLVERS, *EFFECTS]}
+            for start in range(0, count, chunk):
+                matrices = generate(min(chunk, count - start), n)
+                for name, solver in SOLVERS.items():
+                    collected[name].append(compare(matrices, solver))
+                for name, (solver, reference) in EFFECTS.items():
+                    collected[name].append(compare(matrices, solver, reference))
+            for name, parts in collected.items():
+                errors = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+                results[corpus, n, name] = summarize(errors)
+    return results
+
+def print_report(results):
+    """Print one row per corpus, size and solver."""
+    print(f"{'corpus':<24} {'n':>3} {'solver':<11} {'w err p50':>10} {'w err p99':>10} {'w err max':>10} "
+          f"{'CR err p50':>10} {'CR err p99':>10} {'CR err max':>10} {'false acc':>9} {'false rej':>9} {'near 0.1':>8}")
+    for (corpus, n, name), summary in results.items():
+        w, c = summary["weight_error"], summary["cr_error"]
+        print(f"{corpus:<24} {n:>3} {name:<11} {w[50]:>10.2e} {w[99]:>10.2e} {w[100]:>10.2e} "
+              f"{c[50]:>10.2e} {c[99]:>10.2e} {c[100]:>10.2e} "
+              f"{summary['false_accept']:>9} {summary['false_reject']:>9} {summary['near_threshold']:>8}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare AHP weights and CR against a numpy.linalg.eig reference.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(range(3, 11)), help="matrix sizes (3-10)")
+    parser.add_argument("--count", type=int, default=100_000, help="matrices per corpus and size")
+    parser.add_argument("--chunk", type=int, default=20_000, help="matrices generated per batch")
+    parser.add_argument("--sigma", type=float, default=0.2, help="log-normal noise of near-consistent matrices")
+    parser.add_argument("--alpha", type=float, default=0.1, help="Dirichlet alpha of the skewed-weights corpus")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if min(args.sizes) < 3 or max(args.sizes) > len(RI_VALUES):
+        parser.error(f"sizes must be between 3 and {len(RI_VALUES)}")
+    print_report(run(args.sizes, args.count, args.chunk, args.sigma, args.seed, args.alpha))
+
+if __name__ == "__main__":
+    main()
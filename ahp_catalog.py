@@ -0,0 +1,248 @@
+import re
+
+import numpy as np
+
+# Phone name prefixes that do not start with the maker's name
+BRAND_ALIASES = {"iphone": "Apple", "galaxy": "Samsung", "pixel": "Google", "redmi": "Xiaomi"}
+
+# Comparison operators accepted in filter expressions, longest first
+FILTER_OPERATORS = ("<=", ">=", "<", ">", "=")
+
+# Filter names that select phones by maker instead of a criterion
+MAKER_KEYS = ("brand", "maker")
+
+def brand_of(name):
+    """Guess the maker of a phone from its name."""
+    first_word = name.split()[0] if name.split() else ""
+    return BRAND_ALIASES.get(first_word.lower(), first_word)
+
+def parse_filters(text, criteria):
+    """Parse "Price <= 400, Memory >= 4, Brand = Samsung" into (criterion, operator, value) conditions."""
+    conditions = []
+    lookup = {criterion.lower(): criterion for criterion in criteria}
+    for clause in re.split(r"[,;]", text):
+        clause = clause.strip()
+        if not clause:
+            continue
+        for op in FILTER_OPERATORS:
+            if op in clause:
+                name, value = (part.strip() for part in clause.split(op, 1))
+                break
+        else:
+            raise ValueError(f"Filter '{clause}' needs one of {', '.join(FILTER_OPERATORS)}")
+
+        try:
+            number = float(value)
+        except ValueError:
+            number = None
+        # Numbers compare a criterion (including a "Brand" score criterion); text selects a maker
+        if number is not None and name.lower() in lookup:
+            conditions.append((lookup[name.lower()], op, number))
+        elif number is None and name.lower() in MAKER_KEYS:
+            if op != "=":
+                raise ValueError(f"Filter '{clause}' compares a maker with '{op}'")
+            conditions.append((None, op, value))
+        elif name.lower() in lookup:
+            raise ValueError(f"Filter '{clause}' needs a number (text values are only allowed for Brand/Maker)")
+        else:
+            raise ValueError(f"Unknown criterion '{name}' in filter '{clause}'")
+    return conditions
+
+class CatalogIndex:
+    """Sorted per-criterion indexes and maker buckets over a catalog, kept up to date on edits.
+
+    Costs for m phones and n criteria: a query is O(log m + k); update_value is O(log m) plus a
+    memmove of the d entries between the old and new position. add_row appends into spare
+    capacity (amortized O(1) growth) and inserts into each sorted index, O(n log m) plus an
+    O(n (m - pos)) memmove; it touches one maker bucket. remove_row shifts each index the same
+    way, but must renumber every later row, which is O(m n) vectorized plus O(m - row) bucket
+    moves, because rows are positional.
+    """
+    def __init__(self, names, criteria, values, brands=None):
+        self.names = list(names)
+        self.criteria = list(criteria)
+        self._values = np.array(values, dtype=float).reshape(len(self.names), len(self.criteria))
+        self.brands = list(brands) if brands is not None else [brand_of(name) for name in self.names]
+        self.rebuild()
+
+    # The arrays are views of buffers with spare room at the end so rows can be added in place
+    @property
+    def size(self):
+        return len(self.names)
+
+    @property
+    def values(self):
+        return self._values[:self.size]
+
+    @property
+    def sorted_values(self):
+        return self._sorted_values[:, :self.size]
+
+    @property
+    def order(self):
+        return self._order[:, :self.size]
+
+    def rebuild(self):
+        """Build all indexes from scratch."""
+        # order[c] lists the rows sorted by criterion c, sorted_values[c] the matching keys
+        capacity, m = len(self._values), self.size
+        self._order = np.empty((len(self.criteria), capacity), dtype=np.intp)
+        self._order[:, :m] = np.argsort(self.values, axis=0, kind="stable").T
+        self._sorted_values = np.empty((len(self.criteria), capacity))
+        self._sorted_values[:, :m] = np.take_along_axis(self.values.T, self.order, axis=1)
+        self.brand_rows = {}
+        for row, brand in enumerate(self.brands):
+            self.brand_rows.setdefault(brand.lower(), set()).add(row)
+
+    def _reserve(self, rows):
+        """Grow the buffers (doubling) so they hold at least rows rows."""
+        capacity = len(self._values)
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity, 16)
+        m = self.size
+        values = np.empty((capacity, len(self.criteria)))
+        values[:m] = self.values
+        sorted_values = np.empty((len(self.criteria), capacity))
+        sorted_values[:, :m] = self.sorted_values
+        order = np.empty((len(self.criteria), capacity), dtype=np.intp)
+        order[:, :m] = self.order
+        self._values, self._sorted_values, self._order = values, sorted_values, order
+
+    def _position(self, c, row):
+        """Position of a row in criterion c's sorted index."""
+        keys, value = self.sorted_values[c], self._values[row, c]
+        start = np.searchsorted(keys, value, side="left")
+        stop = np.searchsorted(keys, value, side="right")
+        return start + int(np.flatnonzero(self.order[c, start:stop] == row)[0])
+
+    def _span(self, c, op, value):
+        """Positions [start, stop) in sorted_values[c] that satisfy the comparison."""
+        keys = self.sorted_values[c]
+        if op == "<=":
+            return 0, np.searchsorted(keys, value, side="right")
+        if op == "<":
+            return 0, np.searchsorted(keys, value, side="left")
+        if op == ">=":
+            return np.searchsorted(keys, value, side="left"), len(keys)
+        if op == ">":
+            return np.searchsorted(keys, value, side="right"), len(keys)
+        return np.searchsorted(keys, value, side="left"), np.searchsorted(keys, value, side="right")
+
+    def _candidates(self, condition):
+        """Rows matching a single condition."""
+        criterion, op, value = condition
+        if criterion is None:
+            return np.fromiter(self.brand_rows.get(value.lower(), ()), dtype=np.intp)
+        c = self.criteria.index(criterion)
+        start, stop = self._span(c, op, value)
+        return self.order[c, start:stop]
+
+    def _matches(self, rows, condition):
+        """Check a condition directly against the values of the given rows."""
+        criterion, op, value = condition
+        if criterion is None:
+            return np.array([self.brands[row].lower() == value.lower() for row in rows], dtype=bool)
+        column = self.values[rows, self.criteria.index(criterion)]
+        if op == "<=":
+            return column <= value
+        if op == "<":
+            return column < value
+        if op == ">=":
+            return column >= value
+        if op == ">":
+            return column > value
+        return column == value
+
+    def _size(self, condition):
+        """Number of rows matching a condition, without materializing them."""
+        criterion, op, value = condition
+        if criterion is None:
+            return len(self.brand_rows.get(value.lower(), ()))
+        start, stop = self._span(self.criteria.index(criterion), op, value)
+        return stop - start
+
+    def query(self, conditions):
+        """Return the rows (in catalog order) matching every condition."""
+        if not conditions:
+            return np.arange(len(self.names))
+
+        # Resolve the most selective condition by binary search, then check the rest on its rows only
+        most_selective = min(conditions, key=self._size)
+        rows = self._candidates(most_selective)
+        for condition in conditions:
+            if condition is not most_selective:
+                rows = rows[self._matches(rows, condition)]
+        return np.sort(rows)
+
+    def update_value(self, row, criterion, value):
+        """Change one spec and move it to its new place in that criterion's index."""
+        c = self.criteria.index(criterion)
+        old_value = self.values[row, c]
+        if old_value == value:
+            return
+        keys, order = self.sorted_values[c], self.order[c]
+
+        # Locate the row among entries with the same old value
+        pos = self._position(c, row)
+
+        # Shift only the entries between the old and new position
+        if value > old_value:
+            new_pos = np.searchsorted(keys, value, side="right") - 1
+            keys[pos:new_pos] = keys[pos + 1:new_pos + 1]
+            order[pos:new_pos] = order[pos + 1:new_pos + 1]
+        else:
+            new_pos = np.searchsorted(keys, value, side="left")
+            keys[new_pos + 1:pos + 1] = keys[new_pos:pos]
+            order[new_pos + 1:pos + 1] = order[new_pos:pos]
+        keys[new_pos] = value
+        order[new_pos] = row
+        self.values[row, c] = value
+
+    def update_name(self, row, name, brand=None):
+        """Rename a phone and move it to its maker's bucket."""
+        self.brand_rows[self.brands[row].lower()].discard(row)
+        self.names[row] = name
+        self.brands[row] = brand if brand is not None else brand_of(name)
+        self.brand_rows.setdefault(self.brands[row].lower(), set()).add(row)
+
+    def add_row(self, name, values, brand=None):
+        """Append a phone and insert it into every index in place."""
+        row = self.size
+        values = np.asarray(values, dtype=float)
+        self._reserve(row + 1)
+        self._values[row] = values
+        for c, value in enumerate(values):
+            # Shift the entries after the insertion point one slot into the spare room
+            keys, order = self._sorted_values[c], self._order[c]
+            pos = np.searchsorted(keys[:row], value, side="right")
+            keys[pos + 1:row + 1] = keys[pos:row]
+            order[pos + 1:row + 1] = order[pos:row]
+            keys[pos] = value
+            order[pos] = row
+
+        self.names.append(name)
+        self.brands.append(brand if brand is not None else brand_of(name))
+        self.brand_rows.setdefault(self.brands[row].lower(), set()).add(row)
+        return row
+
+    def remove_row(self, row):
+        """Remove a phone in place; later rows shift up by one."""
+        m = self.size
+        for c in range(len(self.criteria)):
+            keys, order = self._sorted_values[c], self._order[c]
+            pos = self._position(c, row)
+            keys[pos:m - 1] = keys[pos + 1:m]
+            order[pos:m - 1] = order[pos + 1:m]
+        self._values[row:m - 1] = self._values[row + 1:m]
+
+        # Only the removed phone's bucket loses an entry; later rows move down one number in theirs
+        self.brand_rows[self.brands[row].lower()].discard(row)
+        for later in range(row + 1, m):
+            bucket = self.brand_rows[self.brands[later].lower()]
+            bucket.discard(later)
+            bucket.add(later - 1)
+        del self.names[row]
+        del self.brands[row]
+        order = self.order
+        order[order > row] -= 1
@@ -0,0 +1,130 @@
+import csv
+import html
+import json
+import os
+import re
+
+import numpy as np
+
+from ahp_ranking import rank_order
+
+# Export format by file extension
+EXPORT_FORMATS = {".csv": "csv", ".json": "json", ".html": "html", ".htm": "html"}
+
+def export_format(path):
+    """Pick the export format from a file name."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{extension}' (expected one of {', '.join(EXPORT_FORMATS)})")
+    return EXPORT_FORMATS[extension]
+
+def plain_text(markup):
+    """Strip the simple rich-text tags used in on-screen messages."""
+    return re.sub(r"<[^>]+>", "", markup)
+
+def iter_ranking_chunks(alternatives, alternatives_scores, totals, order, chunk_rows=4096):
+    """Yield (first rank, names, score rows or None, totals) in ranking order, one chunk at a time."""
+    totals = np.asarray(totals)
+    for start in range(0, len(order), chunk_rows):
+        idx = order[start:start + chunk_rows]
+        # Fancy indexing copies only this chunk of the breakdown
+        scores = None if alternatives_scores is None else np.asarray(alternatives_scores)[idx].tolist()
+        yield start, [alternatives[i] for i in idx], scores, totals[idx].tolist()
+
+def _write_csv(out, criteria, weights, consistency, conclusion, chunks, breakdown):
+    # Summary lines are comments so CSV readers can skip them (e.g. pandas comment="#")
+    out.write(f"# {consistency[0]} = {consistency[1]:.6f}\n" if consistency else "")
+    out.write("# Weights: " + ", ".join(f"{c} = {w:.6f}" for c, w in zip(criteria, weights)) + "\n")
+    if conclusion:
+        out.write(f"# {conclusion}\n")
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["Rank", "Phone"] + (list(criteria) if breakdown else []) + ["Total Score"])
+    for start, names, scores, totals in chunks:
+        writer.writerows([start + i + 1, name] + (scores[i] if breakdown else []) + [total]
+                         for i, (name, total) in enumerate(zip(names, totals)))
+        yield len(names)
+
+def _write_json(out, criteria, weights, consistency, conclusion, chunks, breakdown):
+    # The summary is written as one object whose ranking array is then streamed
+    summary = {
+        "criteria": list(criteria),
+        "weights": dict(zip(criteria, map(float, weights))),
+        "consistency": {consistency[0]: consistency[1]} if consistency else {},
+        "conclusion": conclusion,
+    }
+    out.write(json.dumps(summary, indent=1)[:-2] + ',\n "ranking": [')
+    separator = "\n  "
+    for start, names, scores, totals in chunks:
+        rows = []
+        for i, (name, total) in enumerate(zip(names, totals)):
+            row = {"rank": start + i + 1, "phone": name}
+            if breakdown:
+                row["scores"] = dict(zip(criteria, scores[i]))
+            row["total"] = total
+            rows.append(json.dumps(row))
+        out.write(separator + ",\n  ".join(rows))
+        separator = ",\n  "
+        yield len(names)
+    out.write("\n ]\n}\n")
+
+def _write_html(out, criteria, weights, consistency, conclusion, chunks, breakdown):
+    e = html.escape
+    out.write("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>AHP Results</title>\n"
+              "<style>body{font-family:Roboto,Arial,sans-serif;color:#263238}"
+              "table{border-collapse:collapse}th{background:#26A69A;color:white}"
+              "td,th{padding:4px 10px;border-bottom:1px solid #F0F0F0;text-align:right}"
+              "td:nth-child(2){text-align:left}</style></head><body>\n<h1>AHP Results</h1>\n")
+    if conclusion:
+        out.write(f"<p>{e(conclusion)}</p>\n")
+    if consistency:
+        out.write(f"<p>{e(consistency[0])} = {consistency[1]:.4f}</p>\n")
+    out.write("<table><tr>" + "".join(f"<th>{e(c)}</th>" for c in criteria) + "</tr>\n<tr>"
+              + "".join(f"<td>{w:.4f}</td>" for w in weights) + "</tr></table>\n")
+    headers = ["Rank", "Phone"] + (list(criteria) if breakdown else []) + ["Total Score"]
+    out.write("<h2>Ranking</h2>\n<table>\n<tr>" + "".join(f"<th>{e(h)}</th>" for h in headers) + "</tr>\n")
+    for start, names, scores, totals in chunks:
+        rows = []
+        for i, (name, total) in enumerate(zip(names, totals)):
+            cells = "".join(f"<td>{value:.4f}</td>" for value in scores[i]) if breakdown else ""
+            rows.append(f"<tr><td>{start + i + 1}</td><td>{e(name)}</td>{cells}<td>{total:.4f}</td></tr>\n")
+        out.write("".join(rows))
+        yield len(names)
+    out.write("</table>\n</body></html>\n")
+
+WRITERS = {"csv": _write_csv, "json": _write_json, "html": _write_html}
+
+def export_results(path, alternatives, criteria, alternatives_scores, totals, weights, order=None,
+                   consistency=None, conclusion="", fmt=None, chunk_rows=4096, progress=None, should_stop=None):
+    """Stream the ranking, per-criterion breakdown, weights and CR/GCI to CSV, JSON or HTML.
+
+    Rows are formatted chunk by chunk straight from the score arrays. progress(done, total) is called
+    after every chunk and should_stop() can cancel the export; the file only appears once complete.
+    Returns True if the export finished.
+    """
+    fmt = fmt or export_format(path)
+    if order is None:
+        order = rank_order(totals)
+    breakdown = alternatives_scores is not None
+    chunks = iter_ranking_chunks(alternatives, alternatives_scores, totals, order, chunk_rows)
+    total_rows, done = len(order), 0
+
+    # Write to a temporary file so a cancelled or failed export leaves nothing half-written behind
+    partial = path + ".part"
+    try:
+        with open(partial, "w", encoding="utf-8", newline="") as out:
+            for written in WRITERS[fmt](out, criteria, weights, consistency, plain_text(conclusion), chunks, breakdown):
+                done += written
+                if progress is not None:
+                    progress(done, total_rows)
+                if should_stop is not None and should_stop():
+                    break
+            else:
+                out.close()
+                os.replace(partial, path)
+                return True
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.remove(partial)
+    return False
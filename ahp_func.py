@@ -1,23 +1,194 @@
 import numpy as np
 
+# Random Index values for consistency check
+RI_VALUES = [0, 0, 0.58, 0.9, 1.12, 1.24, 1.32, 1.41, 1.45, 1.49]
+
+# Geometric Consistency Index thresholds by matrix size (0.37 above 4 criteria)
+GCI_THRESHOLDS = {3: 0.31, 4: 0.35}
+
+# Selectable priority methods ("fuzzy" expects (n, n, 3) triangular fuzzy judgments)
+WEIGHT_METHODS = ("arithmetic", "geometric", "fuzzy")
+
+class ReciprocalMatrix:
+    """Pairwise comparison matrix stored as its n(n-1)/2 upper-triangle judgments."""
+    def __init__(self, upper):
+        # Leading axes (if any) hold a batch of matrices of the same size
+        self.values = np.ascontiguousarray(upper, dtype=float)
+        k = self.values.shape[-1]
+        self.n = int(round((1 + np.sqrt(1 + 8 * k)) / 2))
+        if self.n * (self.n - 1) // 2 != k:
+            raise ValueError(f"{k} upper-triangle values do not form a square matrix")
+        self.rows, self.cols = np.triu_indices(self.n, k=1)
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """Pack a dense matrix, keeping only its upper triangle."""
+        matrix = np.asarray(matrix, dtype=float)
+        rows, cols = np.triu_indices(matrix.shape[-1], k=1)
+        return cls(matrix[..., rows, cols])
+
+    @property
+    def shape(self):
+        return self.values.shape[:-1] + (self.n, self.n)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def _position(self, i, j):
+        """Index of judgment (i, j), i < j, in the packed upper triangle."""
+        return i * self.n - i * (i + 1) // 2 + (j - i - 1)
+
+    def __getitem__(self, index):
+        i, j = index
+        if i == j:
+            return 1.0
+        if i < j:
+            return self.values[..., self._position(i, j)]
+        return 1 / self.values[..., self._position(j, i)]
+
+    def __setitem__(self, index, value):
+        # Setting either judgment of a pair sets its reciprocal too
+        i, j = index
+        if value <= 0:
+            raise ValueError("Judgments must be positive")
+        if i == j:
+            if value != 1:
+                raise ValueError("Diagonal judgments are always 1")
+            return
+        if i < j:
+            self.values[..., self._position(i, j)] = value
+        else:
+            self.values[..., self._position(j, i)] = 1 / value
+
+    def to_dense(self):
+        """Expand to a full (..., n, n) matrix."""
+        dense = np.ones(self.shape)
+        dense[..., self.rows, self.cols] = self.values
+        dense[..., self.cols, self.rows] = 1 / self.values
+        return dense
+
+    def _row_sums(self, upper, lower):
+        """Sum upper-triangle contributions into their rows and lower-triangle ones into theirs."""
+        # One bincount over the flattened batch instead of expanding to dense
+        batch = self.values.shape[:-1]
+        size = int(np.prod(batch, dtype=int))
+        offsets = (np.arange(size) * self.n)[:, None]
+        index = np.concatenate([offsets + self.rows, offsets + self.cols], axis=1).ravel()
+        contributions = np.concatenate([
+            np.broadcast_to(upper, batch + (len(self.rows),)).reshape(size, -1),
+            np.broadcast_to(lower, batch + (len(self.rows),)).reshape(size, -1),
+        ], axis=1).ravel()
+        return np.bincount(index, contributions, minlength=size * self.n).reshape(batch + (self.n,))
+
+    def dot(self, vector):
+        """Multiply the matrix by a (batched) vector."""
+        vector = np.asarray(vector, dtype=float)
+        # a_ij * v_j lands in row i, a_ji = 1 / a_ij times v_i lands in row j
+        upper = self.values * vector[..., self.cols]
+        lower = vector[..., self.rows] / self.values
+        return vector + self._row_sums(upper, lower)
+
+    def column_sums(self):
+        """Column sums of the full matrix."""
+        # Column sums are the row sums of the transpose, i.e. with the triangles swapped
+        return 1 + self._row_sums(1 / self.values, self.values)
+
+    def weights(self):
+        """Column-normalized priority weights, matching normalize_and_calculate_weights."""
+        col_sums = self.column_sums() + 1e-10
+        upper = self.values / col_sums[..., self.cols]
+        lower = 1 / (self.values * col_sums[..., self.rows])
+        return (1 / col_sums + self._row_sums(upper, lower)) / self.n
+
+    def geometric_weights(self, return_gci=False):
+        """Row geometric mean weights (and GCI), matching geometric_mean_weights."""
+        n = self.n
+        log_values = np.log(self.values)
+        log_weights = self._row_sums(log_values, -log_values) / n
+        weights = np.exp(log_weights - np.max(log_weights, axis=-1, keepdims=True))
+        weights /= np.sum(weights, axis=-1, keepdims=True)
+        if not return_gci:
+            return weights
+        if n <= 2:
+            return weights, np.zeros(log_weights.shape[:-1])
+        # Each stored judgment appears twice in the full matrix (once inverted)
+        squares = 2 * np.sum(log_values ** 2, axis=-1)
+        gci = (squares - 2 * n * np.sum(log_weights ** 2, axis=-1)) / ((n - 1) * (n - 2))
+        return weights, np.maximum(gci, 0)
+
+def format_judgment(value):
+    """Format a judgment for display, snapping near-integers from reciprocal round trips."""
+    if value >= 1 and abs(value - round(value)) < 0.01:
+        return str(int(round(value)))
+    return str(round(value, 3))
+
 def normalize_and_calculate_weights(matrix):
     """Normalize matrix and calculate priority weights."""
+    if isinstance(matrix, ReciprocalMatrix):
+        return matrix.weights()
+    # Works on a single n x n matrix or a stack of them (..., n, n)
+    matrix = np.asarray(matrix)
     # Add small epsilon to avoid division by zero
-    col_sums = np.sum(matrix, axis=0) + 1e-10
+    col_sums = np.sum(matrix, axis=-2, keepdims=True) + 1e-10
     normalized = matrix / col_sums
-    weights = np.mean(normalized, axis=1)
+    weights = np.mean(normalized, axis=-1)
     return weights
 
+def geometric_mean_weights(matrix, return_gci=False):
+    """Calculate priority weights with the row geometric mean (LLSM) in log space."""
+    if isinstance(matrix, ReciprocalMatrix):
+        return matrix.geometric_weights(return_gci)
+    # Works on a single n x n matrix or a stack of them (..., n, n)
+    log_matrix = np.log(np.asarray(matrix, dtype=float))
+    n = log_matrix.shape[-1]
+    
+    # Row means of the logs are the log weights; shift by the max before
+    # exponentiating so extreme 1/9-9 judgments cannot overflow or underflow
+    log_weights = np.mean(log_matrix, axis=-1)
+    weights = np.exp(log_weights - np.max(log_weights, axis=-1, keepdims=True))
+    weights /= np.sum(weights, axis=-1, keepdims=True)
+    if not return_gci:
+        return weights
+    
+    # For a reciprocal matrix sum_{i<j} (log a_ij - log w_i + log w_j)^2 equals
+    # (sum log^2 a_ij - 2n sum log^2 w_i) / 2, so the GCI needs no second pass over the errors
+    if n <= 2:
+        return weights, np.zeros(log_weights.shape[:-1])
+    squares = np.sum(log_matrix ** 2, axis=(-2, -1))
+    gci = (squares - 2 * n * np.sum(log_weights ** 2, axis=-1)) / ((n - 1) * (n - 2))
+    return weights, np.maximum(gci, 0)
+
+def gci_threshold(n):
+    """Return the acceptable Geometric Consistency Index for an n x n matrix."""
+    if n <= 2:
+        return np.inf
+    return GCI_THRESHOLDS.get(n, 0.37)
+
+def calculate_weights(matrix, method="arithmetic"):
+    """Calculate priority weights with the selected method."""
+    if method == "geometric":
+        return geometric_mean_weights(matrix)
+    if method == "arithmetic":
+        return normalize_and_calculate_weights(matrix)
+    if method == "fuzzy":
+        return fuzzy_extent_weights(matrix)
+    raise ValueError(f"Unknown weight method '{method}' (expected one of {', '.join(WEIGHT_METHODS)})")
+
 def determine_consistency(matrix, weights, ri_values):
     """Calculate Consistency Ratio (CR)."""
-    n = len(weights)
+    weights = np.asarray(weights)
+    n = weights.shape[-1]
     if n <= 1:
         return 0  # No inconsistency for 1x1 matrix
     
-    # Calculate lambda_max
-    weighted_sum = matrix @ weights  # Matrix multiplication is clearer
+    # Calculate lambda_max (batched over any leading axes)
+    if isinstance(matrix, ReciprocalMatrix):
+        weighted_sum = matrix.dot(weights)
+    else:
+        weighted_sum = (np.asarray(matrix) @ weights[..., None])[..., 0]
     lambda_i = weighted_sum / weights
-    lambda_max = np.mean(lambda_i)
+    lambda_max = np.mean(lambda_i, axis=-1)
     
     # Calculate consistency index and ratio
     ci = (lambda_max - n) / (n - 1)
@@ -29,36 +200,319 @@ def determine_consistency(matrix, weights, ri_values):
     cr = ci / ri_values[n-1]
     return cr
 
-def compute_alternative_score(specs, criteria_matrix):
-    """Compute scores for alternatives based on criteria weights."""
-    # Random Index values for consistency check
-    ri_values = [0, 0, 0.58, 0.9, 1.12, 1.24, 1.32, 1.41, 1.45, 1.49]
+def fuzzify_matrix(matrix, spread=1):
+    """Turn a crisp pairwise matrix into triangular fuzzy judgments (l, m, u)."""
+    matrix = np.asarray(matrix, dtype=float)
+    # Work on the judgment strength (>= 1) and mirror it for reciprocals
+    strength = np.where(matrix >= 1, matrix, 1 / matrix)
+    low = np.clip(strength - spread, 1, 9)
+    high = np.clip(strength + spread, 1, 9)
+    fuzzy = np.where(
+        (matrix >= 1)[..., None],
+        np.stack([low, matrix, high], axis=-1),
+        np.stack([1 / high, matrix, 1 / low], axis=-1),
+    )
+    # Equal judgments (and the diagonal) stay crisp to keep reciprocity
+    fuzzy[matrix == 1] = 1
+    return np.ascontiguousarray(fuzzy)
+
+def fuzzy_matrix_from_ranges(lower, upper):
+    """Build an (n, n, 3) fuzzy matrix from range judgments like "between 3 and 5"."""
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    # Geometric midpoint keeps the reciprocal of a range equal to the range of reciprocals
+    middle = np.sqrt(lower * upper)
+    return np.ascontiguousarray(np.stack([lower, middle, upper], axis=-1))
+
+def fuzzy_synthetic_extents(fuzzy_matrix):
+    """Calculate the fuzzy synthetic extent (l, m, u) of every row."""
+    fuzzy_matrix = np.ascontiguousarray(fuzzy_matrix, dtype=float)
+    row_sums = np.sum(fuzzy_matrix, axis=-2)
+    total = np.sum(row_sums, axis=-2, keepdims=True)
+    # Multiply by the fuzzy inverse of the total: (1/u, 1/m, 1/l)
+    return row_sums / total[..., ::-1]
+
+def fuzzy_extent_weights(fuzzy_matrix):
+    """Calculate defuzzified priority weights using Chang's extent analysis.
+
+    Known limitation of the method: a criterion whose extent does not overlap the best one gets
+    a weight of exactly 0 and drops out of scoring (e.g. Storage and Brand for the fuzzified
+    default matrix), however it was judged against the remaining criteria.
+    """
+    extents = fuzzy_synthetic_extents(fuzzy_matrix)
+    l, m, u = extents[..., 0], extents[..., 1], extents[..., 2]
+    
+    # Degree of possibility V(S_i >= S_j) for every pair at once
+    m_i, m_j = m[..., :, None], m[..., None, :]
+    u_i, l_j = u[..., :, None], l[..., None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        overlap = (l_j - u_i) / ((m_i - u_i) - (m_j - l_j))
+    possibility = np.where(m_i >= m_j, 1.0, np.where(l_j >= u_i, 0.0, overlap))
+    
+    # The row with the largest modal extent always has degree 1, so the sum is positive
+    degrees = np.min(possibility, axis=-1)
+    return degrees / np.sum(degrees, axis=-1, keepdims=True)
+
+def criteria_weights(criteria_matrix, method="arithmetic"):
+    """Calculate criteria weights and their consistency, rejecting inconsistent matrices.
+
+    Returns (weights, (index name, value), message): the index is the GCI for the geometric
+    method and the CR otherwise (fuzzy judgments are checked on their modal values).
+    """
+    # Fuzzy judgments carry a trailing (l, m, u) axis; anything else must be one n x n matrix
+    fuzzy = method == "fuzzy"
+    shape = np.shape(criteria_matrix)
+    if len(shape) != (3 if fuzzy else 2) or shape[0] != shape[1] or (fuzzy and shape[2] != 3):
+        expected = "an n x n x 3 fuzzy matrix" if fuzzy else "a single n x n matrix"
+        return None, None, f"Criteria matrix must be {expected}, got shape {shape}"
     
     # Calculate criteria weights
     try:
-        weights = normalize_and_calculate_weights(criteria_matrix)
+        if fuzzy:
+            weights = fuzzy_extent_weights(criteria_matrix)
+        elif method == "geometric":
+            weights, gci = geometric_mean_weights(criteria_matrix, return_gci=True)
+        else:
+            weights = calculate_weights(criteria_matrix, method)
     except Exception as e:
         return None, None, f"Error calculating weights: {str(e)}"
     
-    # Check consistency
-    cr = determine_consistency(criteria_matrix, weights, ri_values)
-    if cr > 0.1:
-        return None, None, f"Criteria matrix inconsistent (CR = {cr:.4f})"
+    # The geometric method is checked with its own consistency index
+    if method == "geometric":
+        consistency = ("GCI", float(gci))
+        if not gci <= gci_threshold(len(weights)):
+            return None, consistency, f"Criteria matrix inconsistent (GCI = {gci:.4f})"
+        return weights, consistency, "Success"
+    
+    # Check consistency (fuzzy judgments are checked on their modal values)
+    if fuzzy:
+        modal_matrix = np.asarray(criteria_matrix)[..., 1]
+        cr = determine_consistency(modal_matrix, normalize_and_calculate_weights(modal_matrix), RI_VALUES)
+    else:
+        cr = determine_consistency(criteria_matrix, weights, RI_VALUES)
+    consistency = ("CR", float(cr))
+    if not cr <= 0.1:
+        return None, consistency, f"Criteria matrix inconsistent (CR = {cr:.4f})"
+    return weights, consistency, "Success"
+
+def compute_alternative_score(specs, criteria_matrix, method="arithmetic", dtype=np.float64, breakdown=True):
+    """Compute scores for alternatives based on criteria weights."""
+    weights, _, message = criteria_weights(criteria_matrix, method)
+    if weights is None:
+        return None, None, message
     
     # Prepare specs table (skip first row, first column)
     if len(specs) <= 1:
         return None, None, "Not enough specifications provided"
     
-    specs_table = [spec[1:] for spec in specs[1:]]
-    
-    # Calculate alternative scores
+    # Calculate alternative scores; the n weights are solved in float64 and only
+    # the m x n catalog work runs in the requested precision
     try:
-        alternatives_scores = [np.array(spec) * weights for spec in specs_table]
+        specs_values = specs_to_array(specs, dtype)
+        weights = weights.astype(dtype)
+        if not breakdown:
+            # Totals only: skip the m x n per-criterion breakdown
+            return None, specs_values @ weights, "Success"
+        alternatives_scores = specs_values * weights
         totals = np.sum(alternatives_scores, axis=1)
         return alternatives_scores, totals, "Success"
     except Exception as e:
         return None, None, f"Error calculating scores: {str(e)}"
 
+def precision_impact(specs_values, weights, dtype=np.float32, top_k=10):
+    """Compare catalog totals and rankings computed in a reduced dtype against float64."""
+    reference_values = np.asarray(specs_values, dtype=np.float64)
+    reference = reference_values @ np.asarray(weights, dtype=np.float64)
+    reduced = (np.asarray(specs_values, dtype=dtype) @ np.asarray(weights, dtype=dtype)).astype(np.float64)
+    m = len(reference)
+    top_k = min(top_k, m)
+    
+    # Rank displacement of every alternative between the two orders
+    reference_rank = np.empty(m, dtype=np.intp)
+    reference_rank[np.argsort(-reference, kind="stable")] = np.arange(m)
+    reduced_rank = np.empty(m, dtype=np.intp)
+    reduced_rank[np.argsort(-reduced, kind="stable")] = np.arange(m)
+    displacement = np.abs(reference_rank - reduced_rank)
+    
+    error = np.abs(reduced - reference)
+    return {
+        "dtype": np.dtype(dtype).name,
+        "max_abs_error": float(np.max(error, initial=0)),
+        "max_rel_error": float(np.max(error / np.maximum(np.abs(reference), np.finfo(float).tiny), initial=0)),
+        "rank_changes": int(np.count_nonzero(displacement)),
+        "max_rank_shift": int(np.max(displacement, initial=0)),
+        "top_k_overlap": len(np.intersect1d(np.flatnonzero(reference_rank < top_k),
+                                            np.flatnonzero(reduced_rank < top_k))) / max(top_k, 1),
+        "top_k_same_order": bool(np.array_equal(np.argsort(reference_rank)[:top_k], np.argsort(reduced_rank)[:top_k])),
+        "bytes": m * np.shape(specs_values)[-1] * np.dtype(dtype).itemsize,
+        "reference_bytes": reference_values.nbytes,
+    }
+
+def score_profiles(profiles, specs_values, top_k=3, method="arithmetic", return_scores=True, chunk_elements=1 << 24,
+                   dtype=np.float64):
+    """Score one m x n catalog for K preference profiles (K weight vectors or K criteria matrices)."""
+    specs_values = np.asarray(specs_values, dtype=dtype)
+    m = len(specs_values)
+    
+    # A stack of criteria matrices is solved in one batched pass
+    if np.ndim(profiles) == (4 if method == "fuzzy" else 3):
+        weights = calculate_weights(profiles, method)
+    else:
+        weights = np.asarray(profiles, dtype=float)
+    weights = np.atleast_2d(weights).astype(dtype)
+    n_profiles = len(weights)
+    
+    top_k = min(top_k, m)
+    scores = np.empty((n_profiles, m), dtype=dtype) if return_scores else None
+    top_indices = np.empty((n_profiles, top_k), dtype=np.intp)
+    top_scores = np.empty((n_profiles, top_k), dtype=dtype)
+    
+    # Bound the K x m intermediate to about chunk_elements values per matmul
+    specs_t = np.ascontiguousarray(specs_values.T)
+    chunk_size = max(1, chunk_elements // max(m, 1))
+    for start in range(0, n_profiles, chunk_size):
+        stop = min(start + chunk_size, n_profiles)
+        if return_scores:
+            chunk = np.matmul(weights[start:stop], specs_t, out=scores[start:stop])
+        else:
+            chunk = weights[start:stop] @ specs_t
+        
+        # Partial selection of the k best, then sort only those; ties go to the lower index as in rank_order
+        best = np.argpartition(-chunk, top_k - 1, axis=1)[:, :top_k]
+        best_scores = np.take_along_axis(chunk, best, axis=1)
+        order = np.lexsort((best, -best_scores), axis=1)
+        best = np.take_along_axis(best, order, axis=1)
+        
+        # argpartition picks arbitrarily among scores tied with the k-th; re-rank those rows in full
+        straddling = np.flatnonzero(np.count_nonzero(chunk >= best_scores.min(axis=1, keepdims=True), axis=1) > top_k)
+        best[straddling] = np.argsort(-chunk[straddling], axis=1, kind="stable")[:, :top_k]
+        top_indices[start:stop] = best
+        top_scores[start:stop] = np.take_along_axis(chunk, best, axis=1)
+    
+    return scores, top_indices, top_scores
+
+def ratio_comparison_matrices(values, benefit=None):
+    """Derive one m x m comparison matrix per criterion from spec ratios, stacked as (n, m, m)."""
+    columns = _oriented_values(values, benefit).T
+    # a_ij = v_i / v_j for every criterion at once
+    return columns[:, :, None] / columns[:, None, :]
+
+def alternative_priorities(values, benefit=None, matrices=None, dense_limit=256):
+    """Calculate local priorities (m x n) of alternatives under each criterion and each criterion's CR."""
+    values = np.asarray(values, dtype=float)
+    m, n = values.shape
+    
+    # Ratios are only defined for positive specs (0 / 0 would poison every weight with NaN)
+    if matrices is None and not np.all(values > 0):
+        i, j = np.argwhere(~(values > 0))[0]
+        raise ValueError(f"Spec at row {i+1}, col {j+1} must be positive for ratio comparisons")
+    
+    if matrices is None and m > dense_limit:
+        # Ratio matrices are perfectly consistent and their normalized columns are all
+        # v / sum(v), so the priorities follow without building the n stacked m x m matrices
+        oriented = _oriented_values(values, benefit)
+        return oriented / np.sum(oriented, axis=0), np.zeros(n)
+    
+    if matrices is None:
+        matrices = ratio_comparison_matrices(values, benefit)
+    matrices = np.asarray(matrices, dtype=float)
+    if matrices.shape != (n, m, m):
+        raise ValueError(f"Alternative matrices must be stacked as ({n}, {m}, {m})")
+    
+    # One batched pass over all criteria
+    local_weights = normalize_and_calculate_weights(matrices)
+    crs = determine_consistency(matrices, local_weights, RI_VALUES)
+    return local_weights.T, np.broadcast_to(crs, (n,))
+
+def compute_pairwise_alternative_score(specs, criteria_matrix, benefit=None, alternative_matrices=None, method="arithmetic"):
+    """Compute scores from pairwise comparisons of alternatives under each criterion."""
+    weights, _, message = criteria_weights(criteria_matrix, method)
+    if weights is None:
+        return None, None, message
+    
+    if len(specs) <= 1:
+        return None, None, "Not enough specifications provided"
+    
+    try:
+        values = specs_to_array(specs)
+    except Exception as e:
+        return None, None, f"Error reading specifications: {str(e)}"
+    if alternative_matrices is None and not np.all(values > 0):
+        i, j = np.argwhere(~(values > 0))[0]
+        return None, None, f"Spec at row {i+1}, col {j+1} must be positive for ratio comparisons"
+    if alternative_matrices is not None and not np.all(np.asarray(alternative_matrices, dtype=float) > 0):
+        return None, None, "Alternative comparison judgments must be positive"
+    
+    try:
+        local_weights, crs = alternative_priorities(values, benefit, alternative_matrices)
+    except Exception as e:
+        return None, None, f"Error calculating alternative priorities: {str(e)}"
+    
+    # A NaN CR (e.g. from zero judgments in supplied matrices) counts as inconsistent
+    inconsistent = np.flatnonzero(~(crs <= 0.1))
+    if len(inconsistent):
+        j = inconsistent[0]
+        return None, None, f"Alternative matrix for criterion {j+1} inconsistent (CR = {crs[j]:.4f})"
+    
+    alternatives_scores = local_weights * weights
+    totals = local_weights @ weights
+    if not np.all(np.isfinite(totals)):
+        return None, None, "Error calculating scores: non-finite alternative priorities"
+    return alternatives_scores, totals, "Success"
+
+def specs_to_array(specs, dtype=float):
+    """Extract the numeric m x n block from a specs table (skip header row and name column)."""
+    return np.array([spec[1:] for spec in specs[1:]], dtype=dtype)
+
+def pareto_front(values, benefit=None, chunk_size=256):
+    """Return a boolean mask of the alternatives that no other alternative dominates."""
+    values = np.asarray(values, dtype=float)
+    m, n = values.shape
+    # Orient every criterion so that larger is better
+    oriented = values if benefit is None else np.where(np.asarray(benefit, dtype=bool), values, -values)
+    
+    # Sort by total then lexicographically (descending): a dominating alternative
+    # always comes first, so each chunk only has to be checked against the front so far
+    keys = np.vstack([-oriented.T[::-1], -np.sum(oriented, axis=1)])
+    order = np.lexsort(keys)
+    sorted_values = oriented[order]
+    
+    keep = np.zeros(m, dtype=bool)
+    front = np.empty((0, n))
+    for start in range(0, m, chunk_size):
+        chunk = sorted_values[start:start + chunk_size]
+        candidates = order[start:start + chunk_size]
+        # Most alternatives fall to the existing front, so check it before the chunk itself
+        for f_start in range(0, len(front), chunk_size):
+            survivors = ~_dominated_by(chunk, front[f_start:f_start + chunk_size])
+            chunk, candidates = chunk[survivors], candidates[survivors]
+        survivors = ~_dominated_by(chunk, chunk)
+        keep[candidates[survivors]] = True
+        front = np.vstack([front, chunk[survivors]])
+    return keep
+
+def _dominated_by(points, others):
+    """Flag points that are dominated by at least one of the others."""
+    # Accumulate one criterion at a time to keep the temporaries 2-D
+    at_least = np.ones((len(points), len(others)), dtype=bool)
+    equal = np.ones((len(points), len(others)), dtype=bool)
+    for k in range(points.shape[1]):
+        at_least &= others[None, :, k] >= points[:, None, k]
+        equal &= others[None, :, k] == points[:, None, k]
+    return np.any(at_least & ~equal, axis=1)
+
+def pareto_prefilter(values, benefit=None, chunk_size=256):
+    """Indices of the alternatives (rows of an m x n array) to keep before scoring, and how many were dropped."""
+    kept = np.flatnonzero(pareto_front(values, benefit, chunk_size))
+    return kept, len(values) - len(kept)
+
+def _oriented_values(values, benefit=None):
+    """Flip cost criteria (lower is better) so that larger values are always preferred."""
+    values = np.asarray(values, dtype=float)
+    if benefit is None:
+        return values
+    return np.where(np.asarray(benefit, dtype=bool), values, 1 / values)
+
 # crit_matrix_data = [
 #             [1, 5, 3, 3, 7],
 #             [0.2, 1, 0.333, 0.333, 5],
@@ -0,0 +1,131 @@
+import numpy as np
+
+class ChunkedArray:
+    """Read-only array stored as row chunks; edits return a new version sharing every untouched chunk."""
+    def __init__(self, chunks, chunk_rows):
+        self.chunks = tuple(chunks)
+        self.chunk_rows = chunk_rows
+
+    @classmethod
+    def from_array(cls, values, chunk_rows=1024, dtype=float):
+        """Split an array into chunks of chunk_rows rows (copied once)."""
+        values = np.array(values, dtype=dtype)
+        chunks = [values[start:start + chunk_rows] for start in range(0, len(values), chunk_rows)]
+        for chunk in chunks:
+            chunk.flags.writeable = False
+        return cls(chunks, chunk_rows)
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self.chunks)
+
+    def __getitem__(self, index):
+        row = index[0] if isinstance(index, tuple) else index
+        chunk = self.chunks[row // self.chunk_rows]
+        local = (row % self.chunk_rows,) + index[1:] if isinstance(index, tuple) else row % self.chunk_rows
+        return chunk[local]
+
+    def set(self, index, value):
+        """Return a copy with one element changed; only the chunk holding it is copied."""
+        row = index[0] if isinstance(index, tuple) else index
+        c = row // self.chunk_rows
+        chunk = self.chunks[c].copy()
+        local = (row % self.chunk_rows,) + index[1:] if isinstance(index, tuple) else row % self.chunk_rows
+        chunk[local] = value
+        chunk.flags.writeable = False
+        return ChunkedArray(self.chunks[:c] + (chunk,) + self.chunks[c + 1:], self.chunk_rows)
+
+    def to_array(self):
+        return np.concatenate(self.chunks)
+
+    def changed_since(self, other):
+        """Indices (rows, or (row, col) pairs for 2-D data) that differ from another version."""
+        changed = []
+        for c, (mine, theirs) in enumerate(zip(self.chunks, other.chunks)):
+            # Shared chunks are identical by construction, so only copied ones are compared
+            if mine is theirs:
+                continue
+            offset = c * self.chunk_rows
+            for local in np.argwhere(mine != theirs):
+                changed.append((offset + local[0],) + tuple(local[1:]) if mine.ndim > 1 else offset + local[0])
+        return changed
+
+class HistoryState:
+    """One point in the edit history with the results calculated for it."""
+    def __init__(self, label, judgments, specs, names):
+        self.label = label
+        self.judgments = judgments
+        self.specs = specs
+        self.names = names
+        # Calculation results keyed by the settings they were computed with
+        self.results = {}
+
+class EditHistory:
+    """Linear undo/redo history of judgment, spec and name edits."""
+    def __init__(self, judgments, specs_values, names, limit=100, chunk_rows=1024):
+        self.limit = limit
+        judgments = np.array(judgments, dtype=float)
+        judgments.flags.writeable = False
+        initial = HistoryState("Start", judgments, ChunkedArray.from_array(specs_values, chunk_rows),
+                               ChunkedArray.from_array(names, chunk_rows, dtype=object))
+        self.states = [initial]
+        self.position = 0
+
+    @property
+    def current(self):
+        return self.states[self.position]
+
+    def can_undo(self):
+        return self.position > 0
+
+    def can_redo(self):
+        return self.position < len(self.states) - 1
+
+    def push(self, label, judgments=None, specs=None, names=None):
+        """Add a state after the current one (dropping any redo states); unchanged parts are shared."""
+        current = self.current
+        if judgments is not None and not (isinstance(judgments, np.ndarray) and not judgments.flags.writeable):
+            # Read-only arrays are already history snapshots and are shared, not copied
+            judgments = np.array(judgments, dtype=float)
+            judgments.flags.writeable = False
+        state = HistoryState(label,
+                             current.judgments if judgments is None else judgments,
+                             current.specs if specs is None else specs,
+                             current.names if names is None else names)
+        del self.states[self.position + 1:]
+        self.states.append(state)
+        if len(self.states) > self.limit:
+            del self.states[0]
+        self.position = len(self.states) - 1
+        return state
+
+    def record_judgments(self, judgments, label="Edit judgment"):
+        """Record a new set of packed (upper triangle) judgments unless nothing changed."""
+        if np.array_equal(judgments, self.current.judgments):
+            return None
+        return self.push(label, judgments=judgments)
+
+    def record_spec(self, row, col, value, label="Edit spec"):
+        """Record one spec change; only its chunk is copied."""
+        if self.current.specs[row, col] == value:
+            return None
+        return self.push(label, specs=self.current.specs.set((row, col), value))
+
+    def record_name(self, row, name, label="Rename phone"):
+        """Record one phone rename; only its chunk is copied."""
+        if self.current.names[row] == name:
+            return None
+        return self.push(label, names=self.current.names.set(row, name))
+
+    def undo(self):
+        """Step back; returns (previous state, new current state) or None."""
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        return self.states[self.position + 1], self.current
+
+    def redo(self):
+        """Step forward; returns (previous state, new current state) or None."""
+        if not self.can_redo():
+            return None
+        self.position += 1
+        return self.states[self.position - 1], self.current
@@ -0,0 +1,102 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Views of the shared catalog inside each worker process, set by _attach_catalog
+_shared = {}
+
+def _attach_catalog(name, m, n, dtype="float64"):
+    """Map the shared specs and weights block in a worker process."""
+    block = shared_memory.SharedMemory(name=name)
+    data = np.ndarray((m * n + n,), dtype=dtype, buffer=block.buf)
+    _shared["block"] = block
+    _shared["specs"] = data[:m * n].reshape(m, n)
+    _shared["weights"] = data[m * n:]
+
+def _score_shard(start, stop, top_k):
+    """Score rows [start, stop) and return their top-k as (score, index) pairs, best first."""
+    totals = _shared["specs"][start:stop] @ _shared["weights"]
+    k = min(top_k, len(totals))
+    best = np.argpartition(-totals, k - 1)[:k]
+    best = best[np.lexsort((best, -totals[best]))]
+    return [(float(totals[i]), start + int(i)) for i in best]
+
+def _ready():
+    """No-op task used to start every worker up front."""
+    return os.getpid()
+
+class ShardedScorer:
+    """Scoring executor that keeps a process pool and the shared catalog block alive across calls.
+
+    The catalog is copied into shared memory once; each score() call only writes the n weights
+    into the block in place and scores every shard in the already running workers.
+    """
+    def __init__(self, specs_values, workers=None, shard_size=None, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        specs_values = np.asarray(specs_values, dtype=self.dtype)
+        self.m, self.n = m, n = specs_values.shape
+        self.workers = workers or os.cpu_count() or 1
+        # A few shards per worker keeps the pool busy when shards finish unevenly
+        self.shard_size = shard_size or max(1, -(-m // (self.workers * 4)))
+
+        # Specs and weights share one read-only block that every worker maps without copying
+        self.block = shared_memory.SharedMemory(create=True, size=(m * n + n) * self.dtype.itemsize)
+        self.pool = None
+        try:
+            data = np.ndarray((m * n + n,), dtype=self.dtype, buffer=self.block.buf)
+            self.specs = data[:m * n].reshape(m, n)
+            self.weights = data[m * n:]
+            self.specs[:] = specs_values
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_attach_catalog,
+                                            initargs=(self.block.name, m, n, self.dtype.name))
+            # Start every worker now so the first score() call pays no start-up cost
+            for future in [self.pool.submit(_ready) for _ in range(self.workers)]:
+                future.result()
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def update_rows(self, rows, values):
+        """Change catalog rows in place; later score() calls see the new values."""
+        self.specs[rows] = values
+
+    def score(self, weights, top_k=10):
+        """Score the whole catalog for one weight vector and merge the per-shard top-k."""
+        # Workers are idle between calls, so the shared weights can be overwritten in place
+        self.weights[:] = weights
+        futures = [self.pool.submit(_score_shard, start, min(start + self.shard_size, self.m), top_k)
+                   for start in range(0, self.m, self.shard_size)]
+        shards = [future.result() for future in futures]
+
+        # Each shard is already sorted, so a lazy k-way merge yields the global ranking
+        merged = list(islice(heapq.merge(*shards, key=lambda pair: (-pair[0], pair[1])), top_k))
+        top_indices = np.array([index for _, index in merged], dtype=np.intp)
+        top_scores = np.array([score for score, _ in merged])
+        return top_indices, top_scores
+
+    def close(self):
+        """Stop the workers and release the shared block."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        if self.block is not None:
+            # Views into the block must be dropped before it can be closed
+            self.specs = self.weights = None
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+def score_catalog_sharded(specs_values, weights, top_k=10, workers=None, shard_size=None, dtype=np.float64):
+    """Score an m x n catalog once in a temporary ShardedScorer (use ShardedScorer to score repeatedly)."""
+    with ShardedScorer(specs_values, workers, shard_size, dtype) as scorer:
+        return scorer.score(weights, top_k)
@@ -0,0 +1,191 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Result of comparing two calculations, row-aligned with the sorted results table
+# (col_max holds the per-criterion maxima the highlight bands are relative to)
+RankingDiff = namedtuple("RankingDiff", ["order", "rank_shift", "moved_rows", "changed_cells", "full", "col_max"])
+
+def rank_order(totals):
+    """Return alternative indices sorted by total score (descending, ties keep input order)."""
+    return np.argsort(-np.asarray(totals), kind="stable")
+
+def score_bands(alternatives_scores, col_max=None):
+    """Classify every criterion score into a highlight band (0-3) relative to its column maximum."""
+    scores = np.asarray(alternatives_scores, dtype=float)
+    if col_max is None:
+        col_max = np.max(scores, axis=0)
+    col_max = np.where(col_max > 0, col_max, 1)
+    norm_scores = scores / col_max
+    return np.select([norm_scores > 0.8, norm_scores > 0.6, norm_scores > 0.4], [3, 2, 1], 0)
+
+def diff_rankings(prev_scores, prev_totals, alternatives_scores, totals, decimals=4, order=None, prev_order=None,
+                  changed_rows=None):
+    """Compare two calculations and list only the table rows and cells that need repainting.
+
+    changed_rows (alternative indices whose scores may differ, e.g. from RankingIndex.snapshot)
+    limits the cell comparison to those alternatives while no column maximum moved.
+    """
+    # Orders maintained elsewhere (e.g. by a RankingIndex) are used as-is instead of re-sorting
+    if order is None:
+        order = rank_order(totals)
+    m = len(order)
+
+    # Nothing to compare against: everything is new
+    if prev_totals is None or np.shape(prev_scores) != np.shape(alternatives_scores):
+        col_max = np.max(np.asarray(alternatives_scores, dtype=float), axis=0)
+        return RankingDiff(order, np.zeros(m, dtype=int), np.arange(m), np.empty((0, 2), dtype=int), True, col_max)
+
+    if prev_order is None:
+        prev_order = rank_order(prev_totals)
+
+    # Positive shift means the alternative climbed in the ranking
+    prev_rank = np.empty(m, dtype=int)
+    prev_rank[prev_order] = np.arange(m)
+    new_rank = np.empty(m, dtype=int)
+    new_rank[order] = np.arange(m)
+    rank_shift = prev_rank - new_rank
+
+    # A row whose occupant changed is repainted entirely
+    moved = prev_order != order
+
+    # Rows that kept their phone only repaint cells whose text or highlight changed.
+    # Columns are laid out as in the results table: criteria first, total last.
+    def displayed(scores, row_totals, rows, col_max):
+        scores = np.asarray(scores, dtype=float)
+        values = np.column_stack([scores[rows], np.asarray(row_totals)[rows]])
+        bands = np.column_stack([score_bands(scores[rows], col_max), np.zeros(len(rows), dtype=int)])
+        return np.round(values, decimals), bands
+
+    prev_max = np.max(np.asarray(prev_scores, dtype=float), axis=0)
+    new_max = np.max(np.asarray(alternatives_scores, dtype=float), axis=0)
+    if changed_rows is not None and np.array_equal(prev_max, new_max):
+        # Highlights are relative to unchanged column maxima, so only the changed alternatives can differ
+        alternatives = np.unique(np.asarray(list(changed_rows), dtype=np.intp))
+        table_rows = new_rank[alternatives]
+    else:
+        alternatives, table_rows = order, np.arange(m)
+    prev_values, prev_bands = displayed(prev_scores, prev_totals, alternatives, prev_max)
+    new_values, new_bands = displayed(alternatives_scores, totals, alternatives, new_max)
+    changed = (prev_values != new_values) | (prev_bands != new_bands)
+    changed[moved[table_rows]] = False
+
+    # Cell columns are offset by one for the phone name column
+    cells = np.argwhere(changed)
+    changed_cells = np.column_stack([table_rows[cells[:, 0]], cells[:, 1] + 1])
+    return RankingDiff(order, rank_shift, np.flatnonzero(moved), changed_cells, False, new_max)
+
+class RankingIndex:
+    """Catalog scores, totals and their ranking, maintained under single-alternative edits.
+
+    Costs: rebuild (new weights) is a full O(m n) rescore plus an O(m log m) sort. update_row
+    rescores one row in O(n), finds its new rank by binary search in O(log m) and shifts the
+    d entries between its old and new rank (a memmove, O(m) in the worst case). add_row and
+    remove_row copy the arrays, O(m n). The first edit after snapshot() copies the
+    snapshotted arrays once, O(m n).
+    """
+    def __init__(self, specs_values, weights):
+        self.values = np.array(specs_values, dtype=float)
+        self.weights = np.array(weights, dtype=float)
+        self.rebuild()
+
+    def rebuild(self):
+        """Rescore and sort the whole catalog (vectorized)."""
+        # Same arithmetic as compute_alternative_score so totals match it exactly
+        self.scores = self.values * self.weights
+        self.totals = np.sum(self.scores, axis=1)
+        self.order = rank_order(self.totals)
+        # Ascending keys (negated totals) so binary search follows the ranking order
+        self.keys = -self.totals[self.order]
+        self.changed = set()
+        self._shared = False
+
+    def snapshot(self):
+        """Return (scores, totals, order, changed rows since the last snapshot) without copying.
+
+        The arrays stay valid: later edits copy them first (copy-on-write).
+        """
+        changed, self.changed = self.changed, set()
+        self._shared = True
+        return self.scores, self.totals, self.order, changed
+
+    def _own(self):
+        """Copy arrays handed out by snapshot() before writing to them."""
+        if self._shared:
+            self.scores = self.scores.copy()
+            self.totals = self.totals.copy()
+            self.order = self.order.copy()
+            self._shared = False
+
+    def set_weights(self, weights):
+        """Change the criteria weights; the catalog is rebuilt only if they actually changed."""
+        weights = np.asarray(weights, dtype=float)
+        if np.array_equal(weights, self.weights):
+            return False
+        self.weights = weights.copy()
+        self.rebuild()
+        return True
+
+    def _insertion_point(self, key, row):
+        """Rank position for (key, row): by key, then by row index among equal totals."""
+        start = np.searchsorted(self.keys, key, side="left")
+        stop = np.searchsorted(self.keys, key, side="right")
+        return start + np.searchsorted(self.order[start:stop], row)
+
+    def rank_of(self, row):
+        """Current rank position (0 = best) of an alternative."""
+        return int(self._insertion_point(-self.totals[row], row))
+
+    def update_row(self, row, values):
+        """Rescore one alternative and move it to its new rank; returns (old rank, new rank)."""
+        values = np.asarray(values, dtype=float)
+        self._own()
+        self.values[row] = values
+        self.scores[row] = values * self.weights
+        self.changed.add(row)
+        total = np.sum(self.scores[row])
+        pos = self.rank_of(row)
+        if total == self.totals[row]:
+            return pos, pos
+
+        # Find the target with the old entry still in place, then shift only the rows in between
+        target = int(self._insertion_point(-total, row))
+        if target > pos:
+            target -= 1
+            self.keys[pos:target] = self.keys[pos + 1:target + 1]
+            self.order[pos:target] = self.order[pos + 1:target + 1]
+        else:
+            self.keys[target + 1:pos + 1] = self.keys[target:pos]
+            self.order[target + 1:pos + 1] = self.order[target:pos]
+        self.keys[target] = -total
+        self.order[target] = row
+        self.totals[row] = total
+        return pos, target
+
+    def add_row(self, values):
+        """Append an alternative and insert it into the ranking; returns its row index."""
+        values = np.asarray(values, dtype=float)
+        row = len(self.values)
+        scores = values * self.weights
+        total = np.sum(scores)
+        target = self._insertion_point(-total, row)
+        self.values = np.vstack([self.values, values])
+        self.scores = np.vstack([self.scores, scores])
+        self.totals = np.append(self.totals, total)
+        self.keys = np.insert(self.keys, target, -total)
+        self.order = np.insert(self.order, target, row)
+        return row
+
+    def remove_row(self, row):
+        """Remove an alternative; later rows shift up by one."""
+        pos = self.rank_of(row)
+        self.values = np.delete(self.values, row, axis=0)
+        self.scores = np.delete(self.scores, row, axis=0)
+        self.totals = np.delete(self.totals, row)
+        self.keys = np.delete(self.keys, pos)
+        self.order = np.delete(self.order, pos)
+        self.order[self.order > row] -= 1
+
+    def top(self, k):
+        """Indices and totals of the k best alternatives."""
+        return self.order[:k], -self.keys[:k]
@@ -0,0 +1,95 @@
+from collections import namedtuple
+
+import numpy as np
+
+from ahp_func import (RI_VALUES, determine_consistency, geometric_mean_weights, gci_threshold,
+                      normalize_and_calculate_weights, score_profiles)
+
+# Everything computed for a set of scenarios; per-scenario arrays share the scenario axis first
+ScenarioComparison = namedtuple("ScenarioComparison",
+                                ["names", "weights", "consistency", "accepted", "scores", "order", "ranks", "correlation"])
+
+class ScenarioSet:
+    """Named criteria matrices kept together so they can be solved as one stack."""
+    def __init__(self):
+        self.names = []
+        self.matrices = []
+
+    def __len__(self):
+        return len(self.names)
+
+    def save(self, name, matrix):
+        """Store a scenario, replacing any scenario with the same name."""
+        matrix = np.array(matrix.to_dense() if hasattr(matrix, "to_dense") else matrix, dtype=float)
+        if self.matrices and matrix.shape != self.matrices[0].shape:
+            raise ValueError(f"Scenario '{name}' must be {self.matrices[0].shape[0]}x{self.matrices[0].shape[1]}")
+        if name in self.names:
+            self.matrices[self.names.index(name)] = matrix
+        else:
+            self.names.append(name)
+            self.matrices.append(matrix)
+
+    def remove(self, name):
+        """Delete a scenario by name."""
+        index = self.names.index(name)
+        del self.names[index]
+        del self.matrices[index]
+
+    def clear(self):
+        self.names = []
+        self.matrices = []
+
+    def stacked(self):
+        """All scenario matrices as one (K, n, n) array."""
+        return np.stack(self.matrices)
+
+def solve_scenarios(matrices, method="arithmetic"):
+    """Weights, consistency index (CR or GCI) and acceptance for a (K, n, n) stack in one batched pass."""
+    matrices = np.asarray(matrices, dtype=float)
+    n = matrices.shape[-1]
+    if method == "geometric":
+        weights, consistency = geometric_mean_weights(matrices, return_gci=True)
+        return weights, consistency, consistency <= gci_threshold(n)
+    weights = normalize_and_calculate_weights(matrices)
+    consistency = np.broadcast_to(determine_consistency(matrices, weights, RI_VALUES), weights.shape[:-1])
+    return weights, consistency, consistency <= 0.1
+
+def rank_positions(order, scores=None):
+    """Turn (K, m) best-first orders into (K, m) rank positions (0 = best) per alternative.
+
+    With the matching scores, tied alternatives share the mean of their positions (average ranks).
+    """
+    m = order.shape[-1]
+    positions = np.arange(m)
+    if scores is None:
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, positions, axis=-1)
+        return ranks
+    
+    # Each run of equal scores along the sorted order gets the midpoint of its first and last position
+    ranked = np.take_along_axis(np.asarray(scores), order, axis=-1)
+    starts = np.ones(ranked.shape, dtype=bool)
+    starts[..., 1:] = ranked[..., 1:] != ranked[..., :-1]
+    ends = np.ones(ranked.shape, dtype=bool)
+    ends[..., :-1] = starts[..., 1:]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=-1)
+    last = np.flip(np.minimum.accumulate(np.flip(np.where(ends, positions, m - 1), axis=-1), axis=-1), axis=-1)
+    ranks = np.empty(ranked.shape)
+    np.put_along_axis(ranks, order, (first + last) / 2, axis=-1)
+    return ranks
+
+def spearman_matrix(ranks):
+    """Spearman rank correlation between every pair of rankings, as a K x K matrix."""
+    # Pearson correlation of (average) ranks is Spearman's rho, ties included; the mean rank is (m-1)/2
+    centered = np.asarray(ranks, dtype=float) - (ranks.shape[-1] - 1) / 2
+    norms = np.sqrt(np.sum(centered ** 2, axis=-1))
+    norms = np.where(norms > 0, norms, 1)
+    return (centered @ centered.T) / np.outer(norms, norms)
+
+def compare_scenarios(names, matrices, specs_values, method="arithmetic"):
+    """Solve all scenarios together, score them against the catalog in one matmul and correlate the rankings."""
+    weights, consistency, accepted = solve_scenarios(matrices, method)
+    m = len(specs_values)
+    scores, order, _ = score_profiles(weights, specs_values, top_k=m)
+    ranks = rank_positions(order, scores)
+    return ScenarioComparison(list(names), weights, consistency, accepted, scores, order, ranks, spearman_matrix(ranks))
@@ -0,0 +1,108 @@
+import os
+import time
+
+import numpy as np
+
+from ahp_func import precision_impact
+from ahp_parallel import ShardedScorer
+
+def timed(func, *args, repeat=3, **kwargs):
+    """Return the best wall-clock time (seconds) over several runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def single_process_top_k(specs, weights, top_k):
+    """Reference: score the whole catalog in this process and pick the top-k."""
+    totals = specs @ weights
+    best = np.argpartition(-totals, top_k - 1)[:top_k]
+    return best[np.argsort(-totals[best], kind="stable")]
+
+def bench_sharded_scaling(sizes=(10**5, 10**6, 10**7), top_k=10):
+    """Print ShardedScorer start-up cost and steady-state scoring time vs one process for each size and worker count."""
+    rng = np.random.default_rng(0)
+    weights = rng.dirichlet(np.ones(5))
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({w for w in (1, 2, 4, 8, 16, 32, 64) if w <= cpus} | {cpus})
+
+    print("Sharded catalog scoring (start-up: pool + shared copy, paid once; score: per call)")
+    print(f"{'phones':>10} {'workers':>8} {'start-up (ms)':>14} {'score (ms)':>11} {'speedup':>8}")
+    for m in sizes:
+        specs = rng.uniform(1, 10, (m, len(weights)))
+        baseline = timed(single_process_top_k, specs, weights, top_k)
+        print(f"{m:>10} {'-':>8} {'-':>14} {baseline * 1000:>11.1f} {1:>8.2f}")
+        for workers in worker_counts:
+            start = time.perf_counter()
+            with ShardedScorer(specs, workers) as scorer:
+                startup = time.perf_counter() - start
+                elapsed = timed(scorer.score, weights, top_k)
+            print(f"{m:>10} {workers:>8} {startup * 1000:>14.1f} {elapsed * 1000:>11.1f} {baseline / elapsed:>8.2f}")
+    print()
+
+def bench_precision(sizes=(10**5, 10**6, 10**7), top_k=10):
+    """Print float32 vs float64 catalog scoring time, memory and ranking agreement."""
+    rng = np.random.default_rng(0)
+    weights = rng.dirichlet(np.ones(5))
+
+    print("Catalog scoring precision (float32 vs float64)")
+    print(f"{'phones':>10} {'f64 (ms)':>9} {'f32 (ms)':>9} {'MB saved':>9} {'max rel err':>12} "
+          f"{'rank moves':>11} {'max shift':>10} {'top-k same':>11}")
+    for m in sizes:
+        specs = rng.uniform(1, 10, (m, len(weights)))
+        specs32 = specs.astype(np.float32)
+        weights32 = weights.astype(np.float32)
+        time64 = timed(np.matmul, specs, weights)
+        time32 = timed(np.matmul, specs32, weights32)
+        report = precision_impact(specs, weights, np.float32, top_k)
+        saved = (report["reference_bytes"] - report["bytes"]) / 2**20
+        print(f"{m:>10} {time64 * 1000:>9.1f} {time32 * 1000:>9.1f} {saved:>9.1f} {report['max_rel_error']:>12.2e} "
+              f"{report['rank_changes']:>11} {report['max_rank_shift']:>10} {str(report['top_k_same_order']):>11}")
+    print()
+
+def bench_startup(repeat=5):
+    """Print GUI start-up time (window shown, lazy tabs unbuilt), full tab build time and reset time."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        print("GUI start-up: skipped (PyQt5 not installed)\n")
+        return
+    from main import PhoneAHPWindow
+
+    app = QApplication.instance() or QApplication([])
+    startup, build_tabs, reset = [], [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        window = PhoneAHPWindow()
+        window.show()
+        app.processEvents()
+        startup.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for index in range(window.tabs.count()):
+            window.ensure_tab(index)
+        build_tabs.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        window.restore_defaults()
+        reset.append(time.perf_counter() - start)
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+    print(f"GUI start-up (best of {repeat})")
+    print(f"{'window shown':>22} {min(startup) * 1000:>8.1f} ms")
+    print(f"{'remaining tabs built':>22} {min(build_tabs) * 1000:>8.1f} ms")
+    print(f"{'reset to defaults':>22} {min(reset) * 1000:>8.1f} ms")
+    print()
+
+def main():
+    bench_startup()
+    bench_precision()
+    bench_sharded_scaling()
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,136 @@
 import sys
+from functools import lru_cache
+
 import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QLabel, QPushButton, QLineEdit, QTableWidget, QTableWidgetItem,
                             QHeaderView, QMessageBox, QTabWidget, QProgressBar, QScrollArea,
-                            QGraphicsDropShadowEffect, QSplitter, QFrame, QGridLayout)
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QSize, QMargins
-from PyQt5.QtGui import QFont, QColor, QPalette, QLinearGradient, QBrush, QPainter, QRadialGradient
+                            QGraphicsDropShadowEffect, QSplitter, QFrame, QGridLayout, QCheckBox, QComboBox,
+                            QShortcut, QFileDialog)
+from PyQt5.QtCore import (Qt, QTimer, QPropertyAnimation, QVariantAnimation, QEasingCurve, QSize, QMargins,
+                          QThread, pyqtSignal)
+from PyQt5.QtGui import QFont, QColor, QPalette, QLinearGradient, QBrush, QPainter, QRadialGradient, QKeySequence
+
+from ahp_func import (criteria_weights, pareto_prefilter, ReciprocalMatrix, format_judgment, specs_to_array)
+from ahp_ranking import diff_rankings, score_bands, RankingIndex
+from ahp_catalog import CatalogIndex, parse_filters
+from ahp_scenarios import ScenarioSet, compare_scenarios
+from ahp_history import EditHistory
+from ahp_export import export_results
+
+# Criteria where a lower value is better (used to highlight the best specs; scoring uses raw values)
+COST_CRITERIA = {"Price"}
+
+# Default dataset shown at start-up and restored by Reset
+DEFAULT_ALTERNATIVES = ["iPhone 12", "Itel A56", "Tecno Camon 12", "Infinix Hot 10",
+                        "Huawei P30", "Google Pixel 7", "Xiaomi Redmi Note 10",
+                        "Samsung Galaxy S22", "Motorola Razr+", "iPhone XR",
+                        "Samsung Galaxy Note 10"]
+DEFAULT_CRITERIA = ["Memory", "Storage", "CPU Frequency", "Price", "Brand"]
+DEFAULT_CRITERIA_MATRIX = [
+    [1, 5, 3, 3, 7],
+    [0.2, 1, 0.333, 0.333, 5],
+    [0.333, 3, 1, 1, 5],
+    [0.333, 3, 1, 1, 5],
+    [0.143, 0.2, 0.2, 0.2, 1]
+]
+# Memory (GB), Storage (GB), CPU Frequency (GHz), Price (USD), Brand score - one row per phone
+DEFAULT_SPECS = [
+    [8, 256, 3.0, 800, 8],
+    [2, 64, 1.5, 150, 1],
+    [3, 64, 1.8, 200, 2],
+    [3, 64, 1.8, 200, 2],
+    [4, 128, 2.0, 300, 7],
+    [12, 256, 3.0, 700, 8],
+    [4, 128, 2.0, 300, 5],
+    [12, 512, 3.2, 1000, 10],
+    [4, 128, 2.0, 400, 5],
+    [6, 128, 2.5, 600, 7],
+    [6, 256, 2.8, 900, 9]
+]
+SPEC_HEADERS = ["Phone", "Memory (GB)", "Storage (GB)", "CPU Frequency (GHz)", "Price (USD)", "Brand Score"]
+
+def judgment_colors(values):
+    """Background color for each judgment value, based on preference intensity."""
+    values = np.asarray(values, dtype=float)
+    # Values less than 1 (inverse preferences) fade with their intensity
+    intensity = np.clip(values * 0.8, 0.2, 1.0)
+    inverse = np.char.mod("rgba(224, 224, 224, %s)", intensity.astype(str))
+    return np.select(
+        [values >= 7, values >= 5, values >= 3, values > 1],
+        ["#26A69A", "#4DB6AC", "#80CBC4", "#B2DFDB"],
+        default=inverse
+    )
+
+def matrix_cell_colors(matrix):
+    """Background color of every criteria matrix cell, computed for the whole matrix at once."""
+    colors = judgment_colors(matrix).astype(object)
+    np.fill_diagonal(colors, "#E0E0E0")  # Diagonal is always 1
+    return colors
+
+def spec_cell_colors(values, benefit):
+    """Highlight color of every spec cell ("" for none), computed for the whole catalog at once."""
+    values = np.asarray(values, dtype=float)
+    benefit = np.asarray(benefit, dtype=bool)
+    col_max, col_min = np.max(values, axis=0), np.min(values, axis=0)
+    best = np.where(benefit, col_max, col_min)
+    # Higher is better: ratio to the best; lower is better: distance from the best
+    intensity = np.where(benefit, values / (best + 0.1), 1 - (values - best) / (col_max - best + 1))
+    return np.where(values == best, "#B2DFDB", np.where(intensity > 0.8, "#E0F2F1", ""))
+
+@lru_cache(maxsize=None)
+def default_cell_colors():
+    """Colors of the default dataset, computed once and shared by start-up and Reset."""
+    benefit = [criterion not in COST_CRITERIA for criterion in DEFAULT_CRITERIA]
+    return matrix_cell_colors(DEFAULT_CRITERIA_MATRIX), spec_cell_colors(DEFAULT_SPECS, benefit)
+
+def build_conclusion(alternatives, totals, order):
+    """Recommendation text for a ranking (rich text with the winner in bold)."""
+    ideal_phone = alternatives[order[0]]
+    ideal_score = totals[order[0]]
+    if len(order) < 2:
+        # e.g. the Pareto prefilter left a single phone that beats all others on every criterion
+        return (f"The <b>{ideal_phone}</b> is at least as good as every other phone on every criterion, "
+                f"with an overall score of <b>{ideal_score:.4f}</b>.")
+    second_phone = alternatives[order[1]]
+    second_score = totals[order[1]]
+    
+    # Calculate percentage difference between top phones
+    percentage_diff = ((ideal_score - second_score) / second_score) * 100 if second_score > 0 else 0
+    
+    conclusion_text = (
+        f"Based on your criteria preferences, the <b>{ideal_phone}</b> is the optimal choice "
+        f"with an overall score of <b>{ideal_score:.4f}</b>. "
+    )
+    
+    if percentage_diff > 15:
+        conclusion_text += f"It significantly outperforms the {second_phone} by {percentage_diff:.1f}%."
+    elif percentage_diff > 5:
+        conclusion_text += f"It outperforms the {second_phone} by {percentage_diff:.1f}%."
+    else:
+        conclusion_text += f"It slightly edges out the {second_phone} (difference: {percentage_diff:.1f}%)."
+    return conclusion_text
+
+class ExportWorker(QThread):
+    """Write a results report in a background thread."""
+    progress = pyqtSignal(int)
+    done = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, path, report, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.report = report
 
-from ahp_func import compute_alternative_score, normalize_and_calculate_weights
+    def run(self):
+        try:
+            finished = export_results(self.path, **self.report,
+                                      progress=lambda done, total: self.progress.emit(int(done * 100 / max(total, 1))),
+                                      should_stop=self.isInterruptionRequested)
+            if finished:
+                self.done.emit(self.path)
+        except Exception as e:
+            self.failed.emit(str(e))
 
 class CustomTableWidget(QTableWidget):
     """Enhanced table widget with better visual presentation"""
@@ -94,13 +217,25 @@ class PhoneAHPWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Smart Phone Selector - AHP Analysis")
         self.setGeometry(100, 100, 1200, 900)
-        self.alternatives = ["iPhone 12", "Itel A56", "Tecno Camon 12", "Infinix Hot 10", 
-                             "Huawei P30", "Google Pixel 7", "Xiaomi Redmi Note 10", 
-                             "Samsung Galaxy S22", "Motorola Razr+", "iPhone XR", 
-                             "Samsung Galaxy Note 10"]
-        self.criteria = ["Memory", "Storage", "CPU Frequency", "Price", "Brand"]
+        self.alternatives = list(DEFAULT_ALTERNATIVES)
+        self.criteria = list(DEFAULT_CRITERIA)
         self.n_alts = len(self.alternatives)
         self.n_crits = len(self.criteria)
+        # Last displayed calculation, used to repaint only what changed
+        self.last_results = None
+        self.rank_animations = []
+        # Ranking of the scored phones, kept up to date as specs are edited
+        self.ranking = None
+        self.ranking_rows = None
+        # Named criteria matrices compared side by side
+        self.scenarios = ScenarioSet()
+        # Latest displayed results and the thread exporting them
+        self.report = None
+        self.export_worker = None
+        # Undo/redo history; unbuilt tabs show the defaults, so the history starts from them
+        self.history = EditHistory(ReciprocalMatrix.from_dense(DEFAULT_CRITERIA_MATRIX).values,
+                                   DEFAULT_SPECS, DEFAULT_ALTERNATIVES)
+        self.default_state = self.history.current
         self.init_ui()
 
     def init_ui(self):
@@ -220,7 +355,89 @@ class PhoneAHPWindow(QMainWindow):
         self.tabs.setFont(QFont("Roboto", 14))
         main_layout.addWidget(self.tabs)
 
-        # Tab 1: Alternatives & Criteria
+        # Only the first tab is built up front; the others are built on first view
+        self.tab_builders = {1: self.build_matrix_tab, 2: self.build_results_tab}
+        self.tabs.addTab(self.build_inputs_tab(), "Phones & Criteria")
+        for title in ["Criteria Preferences", "Results"]:
+            page = QWidget()
+            page_layout = QVBoxLayout()
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            page.setLayout(page_layout)
+            self.tabs.addTab(page, title)
+        self.tabs.currentChanged.connect(self.ensure_tab)
+
+        # Button Section
+        btn_card = CardWidget()
+        btn_layout = QHBoxLayout()
+        
+        compute_btn = QPushButton("Calculate")
+        compute_btn.setIcon(self.style().standardIcon(self.style().SP_DialogApplyButton))
+        compute_btn.setIconSize(QSize(20, 20))
+        compute_btn.clicked.connect(self.compute_ahp)
+        compute_btn.setMinimumHeight(50)
+        compute_btn.setCursor(Qt.PointingHandCursor)
+        
+        reset_btn = QPushButton("Reset")
+        reset_btn.setIcon(self.style().standardIcon(self.style().SP_DialogResetButton))
+        reset_btn.setIconSize(QSize(20, 20))
+        reset_btn.clicked.connect(self.reset_inputs)
+        reset_btn.setMinimumHeight(50)
+        reset_btn.setStyleSheet("background-color: #BDBDBD;")
+        reset_btn.setCursor(Qt.PointingHandCursor)
+        
+        # Undo/redo of judgment and spec edits
+        self.undo_btn = QPushButton("Undo")
+        self.undo_btn.setIcon(self.style().standardIcon(self.style().SP_ArrowBack))
+        self.undo_btn.setIconSize(QSize(20, 20))
+        self.undo_btn.setToolTip("Undo the last judgment or spec edit (Ctrl+Z)")
+        self.undo_btn.clicked.connect(self.undo_edit)
+        self.undo_btn.setMinimumHeight(50)
+        self.undo_btn.setStyleSheet("background-color: #BDBDBD;")
+        self.undo_btn.setCursor(Qt.PointingHandCursor)
+        
+        self.redo_btn = QPushButton("Redo")
+        self.redo_btn.setIcon(self.style().standardIcon(self.style().SP_ArrowForward))
+        self.redo_btn.setIconSize(QSize(20, 20))
+        self.redo_btn.setToolTip("Redo the last undone edit (Ctrl+Y)")
+        self.redo_btn.clicked.connect(self.redo_edit)
+        self.redo_btn.setMinimumHeight(50)
+        self.redo_btn.setStyleSheet("background-color: #BDBDBD;")
+        self.redo_btn.setCursor(Qt.PointingHandCursor)
+        
+        QShortcut(QKeySequence.Undo, self, self.undo_edit)
+        QShortcut(QKeySequence.Redo, self, self.redo_edit)
+        self.update_history_buttons()
+        
+        btn_layout.addWidget(compute_btn)
+        btn_layout.addWidget(self.undo_btn)
+        btn_layout.addWidget(self.redo_btn)
+        btn_layout.addWidget(reset_btn)
+        btn_card.addLayout(btn_layout)
+        main_layout.addWidget(btn_card)
+
+        # Progress Bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setMinimumHeight(10)
+        self.progress_bar.setMaximumHeight(10)
+        self.progress_bar.setTextVisible(False)
+        main_layout.addWidget(self.progress_bar)
+
+        # Add stretch to push everything up
+        main_layout.addStretch()
+
+    def ensure_tab(self, index):
+        """Build a tab the first time it is needed."""
+        builder = self.tab_builders.pop(index, None)
+        if builder:
+            self.tabs.widget(index).layout().addWidget(builder())
+
+    def tab_built(self, index):
+        """Check whether a lazily built tab exists yet."""
+        return index not in self.tab_builders
+
+    def build_inputs_tab(self):
+        """Build the Phones & Criteria tab."""
         tab1 = QWidget()
         tab1_layout = QVBoxLayout()
         tab1.setLayout(tab1_layout)
@@ -242,7 +459,7 @@ class PhoneAHPWindow(QMainWindow):
         alt_label.setToolTip("Enter phone names separated by commas")
         input_grid.addWidget(alt_label, 0, 0)
         
-        self.alt_input = QLineEdit("iPhone 12,Itel A56,Tecno Camon 12,Infinix Hot 10,Huawei P30,Google Pixel 7,Xiaomi Redmi Note 10,Samsung Galaxy S22,Motorola Razr+,iPhone XR,Samsung Galaxy Note 10")
+        self.alt_input = QLineEdit(",".join(DEFAULT_ALTERNATIVES))
         self.alt_input.setProperty("valid", True)
         self.alt_input.textChanged.connect(self.validate_inputs)
         self.alt_input.setPlaceholderText("Phone models separated by commas...")
@@ -254,18 +471,35 @@ class PhoneAHPWindow(QMainWindow):
         crit_label.setToolTip("Enter criteria like Memory, Storage, Brand")
         input_grid.addWidget(crit_label, 1, 0)
         
-        self.crit_input = QLineEdit("Memory,Storage,CPU Frequency,Price,Brand")
+        self.crit_input = QLineEdit(",".join(DEFAULT_CRITERIA))
         self.crit_input.setProperty("valid", True)
         self.crit_input.textChanged.connect(self.validate_inputs)
         self.crit_input.setPlaceholderText("Criteria separated by commas...")
         input_grid.addWidget(self.crit_input, 1, 1)
         
+        # Filter section
+        filter_label = QLabel("Filter:")
+        filter_label.setFont(QFont("Roboto", 14))
+        filter_label.setToolTip("Only phones matching every condition are scored")
+        input_grid.addWidget(filter_label, 2, 0)
+        
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("e.g. Price <= 400, Memory >= 4, Brand = Samsung (optional)")
+        input_grid.addWidget(self.filter_input, 2, 1)
+        
         tab1_card.addLayout(input_grid)
+        
+        # Optional Pareto prefilter
+        self.pareto_checkbox = QCheckBox("Skip dominated phones (worse or equal on every criterion)")
+        self.pareto_checkbox.setToolTip("Phones beaten on every criterion by another phone are removed before scoring")
+        self.pareto_checkbox.setStyleSheet("color: #546E7A;")
+        tab1_card.addWidget(self.pareto_checkbox)
         tab1_layout.addWidget(tab1_card)
         tab1_layout.addStretch()
-        self.tabs.addTab(tab1, "Phones & Criteria")
+        return tab1
 
-        # Tab 2: Criteria Matrix
+    def build_matrix_tab(self):
+        """Build the Criteria Preferences tab."""
         tab2 = QWidget()
         tab2_layout = QVBoxLayout()
         tab2.setLayout(tab2_layout)
@@ -316,46 +550,46 @@ class PhoneAHPWindow(QMainWindow):
         scale_box.setLayout(scale_layout)
         tab2_card.addWidget(scale_box)
         
+        # Priority method selection
+        method_layout = QHBoxLayout()
+        method_label = QLabel("Priority method:")
+        method_label.setFont(QFont("Roboto", 12))
+        self.method_combo = QComboBox()
+        self.method_combo.addItem("Column normalization (CR check)", "arithmetic")
+        self.method_combo.addItem("Row geometric mean (GCI check)", "geometric")
+        self.method_combo.setToolTip("The geometric mean is more robust for extreme 1/9-9 judgments")
+        method_layout.addWidget(method_label)
+        method_layout.addWidget(self.method_combo)
+        method_layout.addStretch()
+        tab2_card.addLayout(method_layout)
+        
+        # Named scenarios, compared side by side on the Results tab
+        scenario_layout = QHBoxLayout()
+        self.scenario_input = QLineEdit()
+        self.scenario_input.setPlaceholderText("Scenario name, e.g. Budget buyer")
+        save_scenario_btn = QPushButton("Save Scenario")
+        save_scenario_btn.setToolTip("Store the current comparisons under this name")
+        save_scenario_btn.setCursor(Qt.PointingHandCursor)
+        save_scenario_btn.clicked.connect(self.save_scenario)
+        compare_scenarios_btn = QPushButton("Compare Scenarios")
+        compare_scenarios_btn.setToolTip("Rank the phones under every saved scenario at once")
+        compare_scenarios_btn.setCursor(Qt.PointingHandCursor)
+        compare_scenarios_btn.clicked.connect(self.compare_saved_scenarios)
+        scenario_layout.addWidget(self.scenario_input)
+        scenario_layout.addWidget(save_scenario_btn)
+        scenario_layout.addWidget(compare_scenarios_btn)
+        tab2_card.addLayout(scenario_layout)
+        
+        self.scenarios_label = QLabel("No saved scenarios")
+        self.scenarios_label.setStyleSheet("color: #546E7A; font-style: italic;")
+        tab2_card.addWidget(self.scenarios_label)
+        
         # Criteria matrix table
         self.crit_matrix_table = CustomTableWidget()
-        self.crit_matrix_table.setRowCount(5)
-        self.crit_matrix_table.setColumnCount(5)
-        criteria = ["Memory", "Storage", "CPU Frequency", "Price", "Brand"]
-        self.crit_matrix_table.setHorizontalHeaderLabels(criteria)
-        self.crit_matrix_table.setVerticalHeaderLabels(criteria)
-        
-        crit_matrix_data = [
-            [1, 5, 3, 3, 7],
-            [0.2, 1, 0.333, 0.333, 5],
-            [0.333, 3, 1, 1, 5],
-            [0.333, 3, 1, 1, 5],
-            [0.143, 0.2, 0.2, 0.2, 1]
-        ]
+        self.fill_matrix_table()
         
-        # Fill the table with values and set color coding
-        for i in range(5):
-            for j in range(5):
-                value = round(crit_matrix_data[i][j], 3)
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                self.crit_matrix_table.setItem(i, j, item)
-                
-                # Color coding based on value intensity
-                if i == j:  # Diagonal is always 1
-                    item.setBackground(QColor("#E0E0E0"))
-                elif value >= 7:
-                    item.setBackground(QColor("#26A69A"))
-                    # item.setForeground(QColor("white"))
-                elif value >= 5:
-                    item.setBackground(QColor("#4DB6AC"))
-                elif value >= 3:
-                    item.setBackground(QColor("#80CBC4"))
-                elif value > 1:
-                    item.setBackground(QColor("#B2DFDB"))
-                else:
-                    # Values less than 1 (inverse preferences)
-                    intensity = max(0.2, min(1.0, value * 0.8))
-                    item.setBackground(QColor(f"rgba(224, 224, 224, {intensity})"))
+        # Editing a judgment updates its reciprocal
+        self.crit_matrix_table.itemChanged.connect(self.on_crit_matrix_changed)
                 
         # Adjust the table size
         table_height = self.crit_matrix_table.verticalHeader().length() + 60
@@ -365,10 +599,10 @@ class PhoneAHPWindow(QMainWindow):
         tab2_card.addWidget(self.crit_matrix_table)
         tab2_layout.addWidget(tab2_card)
         tab2_layout.addStretch()
-        self.tabs.addTab(tab2, "Criteria Preferences")
+        return tab2
 
-        # Tab 3: Results (Specifications, Weights, Conclusion)
-        self.tab3 = QWidget()
+    def build_results_tab(self):
+        """Build the Results tab (specifications, weights, conclusion)."""
         tab3_scroll = QScrollArea()
         tab3_scroll.setWidgetResizable(True)
         tab3_container = QWidget()
@@ -385,59 +619,14 @@ class PhoneAHPWindow(QMainWindow):
         specs_card.addWidget(specs_desc)
         
         self.specs_table = CustomTableWidget()
-        self.specs_table.setRowCount(11)
-        self.specs_table.setColumnCount(6)
-        self.specs_table.setHorizontalHeaderLabels(["Phone", "Memory (GB)", "Storage (GB)", "CPU Frequency (GHz)", "Price (USD)", "Brand Score"])
-        
-        memory_specs = [8, 2, 3, 3, 4, 12, 4, 12, 4, 6, 6]  # GB
-        storage_specs = [256, 64, 64, 64, 128, 256, 128, 512, 128, 128, 256]  # GB
-        cpu_specs = [3.0, 1.5, 1.8, 1.8, 2.0, 3.0, 2.0, 3.2, 2.0, 2.5, 2.8]  # GHz
-        price_specs = [800, 150, 200, 200, 300, 700, 300, 1000, 400, 600, 900]  # USD
-        brand_scores = [8, 1, 2, 2, 7, 8, 5, 10, 5, 7, 9]  # Provided
-        
-        for i in range(11):
-            # Phone name - emphasize
-            name_item = QTableWidgetItem(self.alternatives[i])
-            name_item.setFont(QFont("Roboto", 10, QFont.Bold))
-            self.specs_table.setItem(i, 0, name_item)
-            
-            # Specs - highlight special values
-            specs_data = [
-                (memory_specs[i], 1, max(memory_specs)),
-                (storage_specs[i], 2, max(storage_specs)),
-                (cpu_specs[i], 3, max(cpu_specs)),
-                (price_specs[i], 4, min(price_specs)),  # For price, lower is better
-                (brand_scores[i], 5, max(brand_scores))
-            ]
-            
-            for value, col, benchmark in specs_data:
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                
-                # Highlight cells with exceptional values
-                is_best = False
-                if col == 4:  # Price - lower is better
-                    is_best = value == benchmark
-                    intensity = 1 - (value - benchmark) / (max(price_specs) - benchmark + 1)
-                else:  # Other specs - higher is better
-                    is_best = value == benchmark
-                    intensity = value / (benchmark + 0.1)
-                
-                # Set background color based on how good the value is
-                if is_best:
-                    item.setBackground(QColor("#B2DFDB"))
-                elif intensity > 0.8:
-                    item.setBackground(QColor("#E0F2F1"))
-                
-                self.specs_table.setItem(i, col, item)
+        self.fill_specs_table()
         
         specs_card.addWidget(self.specs_table)
+        
+        # Keep the catalog index in sync with edits
+        self.specs_table.itemChanged.connect(self.on_specs_changed)
         self.tab3_layout.addWidget(specs_card)
 
-        specs = [["Alternatives"] + self.criteria]
-        for index, alt in enumerate(self.alternatives):
-            specs.append([alt, memory_specs[index], storage_specs[index], cpu_specs[index], price_specs[index], brand_scores[index]])
-
         # Results Table (Weights and Conclusion)
         self.results_card = CardWidget("Analysis Results")
         self.results_card.setVisible(False)
@@ -451,6 +640,13 @@ class PhoneAHPWindow(QMainWindow):
         results_desc.setStyleSheet("color: #546E7A; font-style: italic; margin-bottom: 10px;")
         self.results_card.addWidget(results_desc)
         
+        # Note about phones removed by the Pareto prefilter
+        self.pruned_label = QLabel()
+        self.pruned_label.setWordWrap(True)
+        self.pruned_label.setStyleSheet("color: #546E7A; margin-bottom: 10px;")
+        self.pruned_label.setVisible(False)
+        self.results_card.addWidget(self.pruned_label)
+        
         # Criteria weights section
         self.weights_box = QWidget()
         weights_layout = QHBoxLayout()
@@ -570,50 +766,48 @@ class PhoneAHPWindow(QMainWindow):
         self.conclusion_frame.setVisible(False)
         
         self.results_card.addWidget(self.conclusion_frame)
+        
+        # Export of the full results (written in a background thread)
+        export_layout = QHBoxLayout()
+        self.export_btn = QPushButton("Export Results")
+        self.export_btn.setIcon(self.style().standardIcon(self.style().SP_DialogSaveButton))
+        self.export_btn.setIconSize(QSize(20, 20))
+        self.export_btn.setToolTip("Save the ranking, scores, weights and consistency as CSV, JSON or HTML")
+        self.export_btn.setCursor(Qt.PointingHandCursor)
+        self.export_btn.setEnabled(False)
+        self.export_btn.clicked.connect(self.export_report)
+        export_layout.addStretch()
+        export_layout.addWidget(self.export_btn)
+        self.results_card.addLayout(export_layout)
         self.tab3_layout.addWidget(self.results_card)
         
-        self.tab3_layout.addStretch()
-        self.tabs.addTab(tab3_scroll, "Results")
-
-        # Button Section
-        btn_card = CardWidget()
-        btn_layout = QHBoxLayout()
+        # Scenario comparison: one ranking column per scenario, then their rank correlations
+        self.scenario_card = CardWidget("Scenario Comparison")
+        self.scenario_card.setVisible(False)
+        self.scenario_summary = QLabel()
+        self.scenario_summary.setWordWrap(True)
+        self.scenario_summary.setStyleSheet("color: #546E7A; margin-bottom: 10px;")
+        self.scenario_card.addWidget(self.scenario_summary)
         
-        compute_btn = QPushButton("Calculate")
-        compute_btn.setIcon(self.style().standardIcon(self.style().SP_DialogApplyButton))
-        compute_btn.setIconSize(QSize(20, 20))
-        compute_btn.clicked.connect(self.compute_ahp)
-        compute_btn.setMinimumHeight(50)
-        compute_btn.setCursor(Qt.PointingHandCursor)
+        self.scenario_table = CustomTableWidget()
+        self.scenario_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.scenario_card.addWidget(self.scenario_table)
         
-        reset_btn = QPushButton("Reset")
-        reset_btn.setIcon(self.style().standardIcon(self.style().SP_DialogResetButton))
-        reset_btn.setIconSize(QSize(20, 20))
-        reset_btn.clicked.connect(self.reset_inputs)
-        reset_btn.setMinimumHeight(50)
-        reset_btn.setStyleSheet("background-color: #BDBDBD;")
-        reset_btn.setCursor(Qt.PointingHandCursor)
+        correlation_label = QLabel("Spearman rank correlation between scenarios")
+        correlation_label.setFont(QFont("Roboto", 12, QFont.Bold))
+        self.scenario_card.addWidget(correlation_label)
+        self.correlation_table = CustomTableWidget()
+        self.correlation_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.scenario_card.addWidget(self.correlation_table)
+        self.tab3_layout.addWidget(self.scenario_card)
         
-        btn_layout.addWidget(compute_btn)
-        btn_layout.addWidget(reset_btn)
-        btn_card.addLayout(btn_layout)
-        main_layout.addWidget(btn_card)
-
-        # Progress Bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setMinimumHeight(10)
-        self.progress_bar.setMaximumHeight(10)
-        self.progress_bar.setTextVisible(False)
-        main_layout.addWidget(self.progress_bar)
-
-        # Add stretch to push everything up
-        main_layout.addStretch()
+        self.tab3_layout.addStretch()
 
         # Animation for results
         self.animation = QPropertyAnimation(self.results_card, b"maximumHeight")
         self.animation.setDuration(600)
         self.animation.setEasingCurve(QEasingCurve.OutCubic)
+        return tab3_scroll
 
     def validate_inputs(self):
         """Validate inputs in real-time."""
@@ -632,18 +826,155 @@ class PhoneAHPWindow(QMainWindow):
             sender.style().unpolish(sender)
             sender.style().polish(sender)
 
-    def get_table_data(self, table):
-        """Extract data from QTableWidget."""
-        rows, cols = table.rowCount(), table.columnCount()
-        data = np.zeros((rows, cols))
-        for i in range(rows):
-            for j in range(cols):
-                item = table.item(i, j)
+    def fill_matrix_table(self, matrix=DEFAULT_CRITERIA_MATRIX, criteria=DEFAULT_CRITERIA, colors=None):
+        """Fill the criteria matrix table (the default matrix reuses its cached colors)."""
+        if colors is None:
+            colors = default_cell_colors()[0] if matrix is DEFAULT_CRITERIA_MATRIX else matrix_cell_colors(matrix)
+        n = len(criteria)
+        self.crit_matrix_table.blockSignals(True)
+        self.crit_matrix_table.setRowCount(n)
+        self.crit_matrix_table.setColumnCount(n)
+        self.crit_matrix_table.setHorizontalHeaderLabels(criteria)
+        self.crit_matrix_table.setVerticalHeaderLabels(criteria)
+        for i in range(n):
+            for j in range(n):
+                self.set_matrix_item(i, j, matrix[i][j], colors[i][j])
+        self.crit_matrix_table.blockSignals(False)
+
+    def set_matrix_item(self, i, j, value, color=None):
+        """Put a judgment into the criteria matrix table with color coding."""
+        item = QTableWidgetItem(format_judgment(value))
+        item.setTextAlignment(Qt.AlignCenter)
+        self.style_matrix_item(item, i, j, value, color)
+        self.crit_matrix_table.setItem(i, j, item)
+
+    def style_matrix_item(self, item, i, j, value, color=None):
+        """Color a criteria matrix cell based on judgment intensity."""
+        if i == j:  # Diagonal is always 1
+            item.setBackground(QColor("#E0E0E0"))
+            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+            return
+        item.setBackground(QColor(color if color is not None else str(judgment_colors(value))))
+
+    def fill_specs_table(self, names=DEFAULT_ALTERNATIVES, specs=DEFAULT_SPECS, colors=None):
+        """Fill the specs table (the default catalog reuses its cached colors) and reindex it."""
+        if colors is None:
+            if specs is DEFAULT_SPECS:
+                colors = default_cell_colors()[1]
+            else:
+                colors = spec_cell_colors(specs, [c not in COST_CRITERIA for c in self.criteria])
+        self.specs_table.blockSignals(True)
+        self.specs_table.setRowCount(len(names))
+        self.specs_table.setColumnCount(len(SPEC_HEADERS))
+        self.specs_table.setHorizontalHeaderLabels(SPEC_HEADERS)
+        for i, name in enumerate(names):
+            # Phone name - emphasize
+            name_item = QTableWidgetItem(name)
+            name_item.setFont(QFont("Roboto", 10, QFont.Bold))
+            self.specs_table.setItem(i, 0, name_item)
+            
+            # Specs - highlight the best and near-best values
+            for col, value in enumerate(specs[i], 1):
+                item = QTableWidgetItem(str(value))
+                item.setTextAlignment(Qt.AlignCenter)
+                if colors[i][col-1]:
+                    item.setBackground(QColor(colors[i][col-1]))
+                self.specs_table.setItem(i, col, item)
+        self.specs_table.blockSignals(False)
+        self.invalid_specs = set()
+        self.build_catalog_index()
+
+    def on_crit_matrix_changed(self, item):
+        """Keep the criteria matrix reciprocal when a judgment is edited."""
+        i, j = item.row(), item.column()
+        try:
+            value = float(item.text())
+        except ValueError:
+            value = None
+        if i == j:
+            return
+        if value is None or value <= 0:
+            if i > j:
+                # Only the upper triangle is read when calculating, so an invalid lower cell
+                # would be silently ignored; show the recorded judgment's reciprocal again
+                self.crit_matrix_table.blockSignals(True)
+                self.set_matrix_item(i, j, ReciprocalMatrix(self.history.current.judgments)[i, j])
+                self.crit_matrix_table.blockSignals(False)
+            return  # Invalid upper cells are reported when calculating
+        
+        # Restyle the edited cell and write the reciprocal into its mirror
+        self.crit_matrix_table.blockSignals(True)
+        self.style_matrix_item(item, i, j, value)
+        self.set_matrix_item(j, i, 1 / value)
+        self.crit_matrix_table.blockSignals(False)
+        self.crit_matrix_table.viewport().update()
+        
+        # Record the edit on a copy of the packed judgments
+        judgments = ReciprocalMatrix(self.history.current.judgments.copy())
+        judgments[i, j] = value
+        self.history.record_judgments(judgments.values)
+        self.update_history_buttons()
+
+    def get_criteria_matrix(self):
+        """Read the criteria judgments (upper triangle only) into a packed reciprocal matrix."""
+        n = self.crit_matrix_table.rowCount()
+        upper = []
+        for i in range(n):
+            for j in range(i + 1, n):
+                item = self.crit_matrix_table.item(i, j)
                 try:
-                    data[i, j] = float(item.text()) if item else 1
+                    value = float(item.text()) if item else 1
                 except:
                     raise ValueError(f"Invalid value at row {i+1}, col {j+1}")
-        return data
+                if value <= 0:
+                    raise ValueError(f"Judgment at row {i+1}, col {j+1} must be positive")
+                upper.append(value)
+        return ReciprocalMatrix(upper)
+
+    def build_catalog_index(self):
+        """Index the specs table by criterion and maker for filtering."""
+        specs = self.get_specs_data()
+        self.catalog_index = CatalogIndex([row[0] for row in specs[1:]], self.criteria, specs_to_array(specs))
+
+    def on_specs_changed(self, item):
+        """Update the catalog index for a single edited spec."""
+        row, col = item.row(), item.column()
+        if col == 0:
+            self.catalog_index.update_name(row, item.text())
+            self.history.record_name(row, item.text())
+            self.update_history_buttons()
+            return
+        try:
+            value = float(item.text())
+        except ValueError:
+            self.invalid_specs.add((row, col))  # Reported when calculating
+            return
+        self.invalid_specs.discard((row, col))
+        self.apply_spec_value(row, col, value)
+        self.history.record_spec(row, col - 1, value)
+        self.update_history_buttons()
+
+    def apply_spec_value(self, row, col, value):
+        """Propagate one spec value to the catalog index and the maintained ranking."""
+        self.catalog_index.update_value(row, self.criteria[col - 1], value)
+        
+        # Rescore just this phone and move it within the ranking
+        if self.ranking is not None:
+            pos = np.searchsorted(self.ranking_rows, row)
+            if pos < len(self.ranking_rows) and self.ranking_rows[pos] == row:
+                self.ranking.update_row(pos, self.catalog_index.values[row])
+
+    def update_ranking(self, rows, weights):
+        """Return (scores, totals, order, changed rows or None) of the scored phones, rescoring only when needed."""
+        if self.ranking is None or not np.array_equal(rows, self.ranking_rows):
+            self.ranking = RankingIndex(self.catalog_index.values[rows], weights)
+            self.ranking_rows = rows
+            rescored = True
+        else:
+            # Spec edits were already applied one row at a time; only new weights rescore everything
+            rescored = self.ranking.set_weights(weights)
+        scores, totals, order, changed = self.ranking.snapshot()
+        return scores, totals, order, None if rescored else changed
 
     def get_specs_data(self):
         """Extract specs from specs_table (including headers)."""
@@ -667,9 +998,173 @@ class PhoneAHPWindow(QMainWindow):
             specs.append(row)
         return specs
 
+    def results_key(self):
+        """Settings outside the edit history that a calculation depends on."""
+        return (self.alt_input.text(), self.crit_input.text(), self.filter_input.text(),
+                self.pareto_checkbox.isChecked(), self.method_combo.currentData() if self.tab_built(1) else "arithmetic")
+
+    def update_history_buttons(self):
+        self.undo_btn.setEnabled(self.history.can_undo())
+        self.redo_btn.setEnabled(self.history.can_redo())
+
+    def undo_edit(self):
+        """Go back one edit."""
+        self.apply_history_step(self.history.undo())
+
+    def redo_edit(self):
+        """Go forward one edit."""
+        self.apply_history_step(self.history.redo())
+
+    def apply_history_step(self, step):
+        """Show a history state, rewriting only what differs from the state shown before."""
+        if step is None:
+            return
+        previous, state = step
+        self.ensure_tab(1)
+        self.ensure_tab(2)
+        
+        if state.judgments is not previous.judgments:
+            self.fill_matrix_table(ReciprocalMatrix(state.judgments).to_dense(), self.criteria)
+        
+        # Only chunks copied between the two states are compared
+        self.specs_table.blockSignals(True)
+        for row in state.names.changed_since(previous.names):
+            self.specs_table.item(row, 0).setText(state.names[row])
+            self.catalog_index.update_name(row, state.names[row])
+        for row, c in state.specs.changed_since(previous.specs):
+            value = float(state.specs[row, c])
+            self.specs_table.item(row, c + 1).setText(str(int(value)) if value.is_integer() else str(value))
+            self.invalid_specs.discard((row, c + 1))
+            self.apply_spec_value(row, c + 1, value)
+        self.specs_table.blockSignals(False)
+        self.update_history_buttons()
+        
+        # Results calculated for this state with the same settings are shown without recomputing
+        cached = state.results.get(self.results_key())
+        if cached is not None:
+            alternatives, criteria, alternatives_scores, totals, weights, order, consistency, notes = cached
+            self.pruned_label.setText(" ".join(notes))
+            self.pruned_label.setVisible(bool(notes))
+            self.results_card.setVisible(True)
+            self.show_results(alternatives, criteria, alternatives_scores, totals, weights, order, consistency)
+        elif self.results_card.isVisible():
+            self.pruned_label.setText("Inputs changed since these results were calculated. Click Calculate to update them.")
+            self.pruned_label.setVisible(True)
+
+    def select_catalog(self, alternatives):
+        """Apply the filter and Pareto prefilter to the indexed catalog; returns the kept table rows, names and notes."""
+        # Keep only the phones matching the filter
+        n_alts = len(alternatives)
+        notes = []
+        scored_rows = np.arange(n_alts)
+        conditions = parse_filters(self.filter_input.text(), self.catalog_index.criteria)
+        if conditions:
+            scored_rows = self.catalog_index.query(conditions)
+            alternatives = [alternatives[i] for i in scored_rows]
+            notes.append(f"The filter kept {len(scored_rows)} of {n_alts} phones.")
+            if len(scored_rows) < 2:
+                raise ValueError("At least two phones must match the filter")
+
+        # Remove dominated phones before weighting
+        if self.pareto_checkbox.isChecked():
+            # compute_alternative_score multiplies raw specs by weights, so a larger value
+            # raises the score on every criterion; dominance must use that same direction
+            kept, n_pruned = pareto_prefilter(self.catalog_index.values[scored_rows])
+            alternatives = [alternatives[i] for i in kept]
+            scored_rows = scored_rows[kept]
+            notes.append(f"{n_pruned} dominated phone(s) were skipped before scoring.")
+        return scored_rows, alternatives, notes
+
+    def check_specs(self):
+        """Raise for the first spec cell that does not hold a number (tracked as cells are edited)."""
+        if self.invalid_specs:
+            row, col = min(self.invalid_specs)
+            raise ValueError(f"Invalid spec value at row {row+1}, col {col+1}")
+
+    def save_scenario(self):
+        """Store the current criteria matrix as a named scenario."""
+        name = self.scenario_input.text().strip() or f"Scenario {len(self.scenarios) + 1}"
+        try:
+            self.scenarios.save(name, self.get_criteria_matrix())
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        self.scenario_input.clear()
+        self.scenarios_label.setText("Saved scenarios: " + ", ".join(self.scenarios.names))
+
+    def compare_saved_scenarios(self):
+        """Solve and score every saved scenario in one pass and show the rankings side by side."""
+        try:
+            self.ensure_tab(2)
+            if len(self.scenarios) < 2:
+                raise ValueError("Save at least two scenarios to compare")
+
+            alternatives = [x.strip() for x in self.alt_input.text().split(",") if x.strip()]
+            criteria = [x.strip() for x in self.crit_input.text().split(",") if x.strip()]
+            if len(alternatives) != self.n_alts or len(criteria) != self.n_crits:
+                raise ValueError("Number of phones and criteria must match defaults for this version")
+
+            self.check_specs()
+            scored_rows, alternatives, notes = self.select_catalog(alternatives)
+            method = self.method_combo.currentData()
+            comparison = compare_scenarios(self.scenarios.names, self.scenarios.stacked(),
+                                           self.catalog_index.values[scored_rows], method)
+            self.show_scenario_comparison(alternatives, comparison, method, notes)
+            self.tabs.setCurrentIndex(2)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Scenario comparison failed: {str(e)}")
+
+    def show_scenario_comparison(self, alternatives, comparison, method, notes):
+        """Fill the side-by-side ranking and correlation tables."""
+        index_name = "GCI" if method == "geometric" else "CR"
+        headers = [f"{name} ({index_name} {value:.3f}{'' if ok else ', inconsistent'})"
+                   for name, value, ok in zip(comparison.names, comparison.consistency, comparison.accepted)]
+
+        # Row r lists the phone ranked r+1 in every scenario
+        n_scenarios, m = comparison.order.shape
+        self.scenario_table.setRowCount(m)
+        self.scenario_table.setColumnCount(n_scenarios)
+        self.scenario_table.setHorizontalHeaderLabels(headers)
+        self.scenario_table.setVerticalHeaderLabels([str(rank + 1) for rank in range(m)])
+        for k in range(n_scenarios):
+            for rank, idx in enumerate(comparison.order[k]):
+                item = QTableWidgetItem(f"{alternatives[idx]}  ({comparison.scores[k, idx]:.4f})")
+                # Highlight phones that place differently than in the first scenario
+                if k > 0 and comparison.ranks[0, idx] != comparison.ranks[k, idx]:
+                    item.setBackground(QColor("#FFF8E1"))
+                self.scenario_table.setItem(rank, k, item)
+
+        self.correlation_table.setRowCount(n_scenarios)
+        self.correlation_table.setColumnCount(n_scenarios)
+        self.correlation_table.setHorizontalHeaderLabels(comparison.names)
+        self.correlation_table.setVerticalHeaderLabels(comparison.names)
+        for i in range(n_scenarios):
+            for j in range(n_scenarios):
+                rho = comparison.correlation[i, j]
+                item = QTableWidgetItem(f"{rho:.3f}")
+                item.setTextAlignment(Qt.AlignCenter)
+                item.setBackground(QColor("#E8F5E9") if rho >= 0.8 else QColor("#FFEBEE") if rho < 0.5 else QColor("white"))
+                self.correlation_table.setItem(i, j, item)
+
+        # Summarize the most and least similar pair
+        pairs = np.triu_indices(n_scenarios, k=1)
+        rhos = comparison.correlation[pairs]
+        most, least = np.argmax(rhos), np.argmin(rhos)
+        summary = notes + [
+            f"Mean rank correlation {np.mean(rhos):.3f}.",
+            f"Most similar: {comparison.names[pairs[0][most]]} and {comparison.names[pairs[1][most]]} ({rhos[most]:.3f}).",
+            f"Least similar: {comparison.names[pairs[0][least]]} and {comparison.names[pairs[1][least]]} ({rhos[least]:.3f}).",
+        ]
+        self.scenario_summary.setText(" ".join(summary))
+        self.scenario_card.setVisible(True)
+
     def compute_ahp(self):
-        """Run AHP and display results using compute_alternative_score."""
+        """Run AHP and display results."""
         try:
+            # The matrix and specs live on tabs that may not have been opened yet
+            self.ensure_tab(1)
+            self.ensure_tab(2)
+            
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
             QTimer.singleShot(100, lambda: self.progress_bar.setValue(30))
@@ -682,39 +1177,49 @@ class PhoneAHPWindow(QMainWindow):
             if n_alts != self.n_alts or n_crits != self.n_crits:
                 raise ValueError("Number of phones and criteria must match defaults for this version")
 
-            criteria_matrix = self.get_table_data(self.crit_matrix_table)
+            criteria_matrix = self.get_criteria_matrix()
             if criteria_matrix.shape != (n_crits, n_crits):
                 raise ValueError(f"Criteria matrix must be {n_crits}x{n_crits}")
 
-            # Get specs from the specs_table (including headers)
-            specs = self.get_specs_data()
-            if len(specs) <= 1 or len(specs[1]) - 1 != n_crits:
+            # Specs come from the catalog index, which follows every valid cell edit
+            self.check_specs()
+            if self.catalog_index.values.shape != (n_alts, n_crits):
                 raise ValueError(f"Specs table must have {n_alts} rows and {n_crits} columns (excluding Phone column)")
 
-            # Calculate criteria weights for display
-            weights = normalize_and_calculate_weights(criteria_matrix)
-            
-            QTimer.singleShot(300, lambda: self.progress_bar.setValue(70))
+            scored_rows, alternatives, notes = self.select_catalog(alternatives)
+            self.pruned_label.setText(" ".join(notes))
+            self.pruned_label.setVisible(bool(notes))
 
-            # Compute scores using the function
-            alternatives_scores, totals, message = compute_alternative_score(specs, criteria_matrix)
-            if totals is None:
+            # Solve the criteria weights once; their consistency is reported with the results
+            method = self.method_combo.currentData()
+            weights, consistency, message = criteria_weights(criteria_matrix, method)
+            if weights is None:
                 self.progress_bar.setVisible(False)
                 QMessageBox.critical(self, "Error", message)
                 return
+            
+            QTimer.singleShot(300, lambda: self.progress_bar.setValue(70))
+
+            # Weighted scores come from the maintained ranking: after spec edits only the edited
+            # rows were rescored, and the whole catalog is rescored only when the weights changed
+            alternatives_scores, totals, order, changed_rows = self.update_ranking(scored_rows, weights)
+            self.history.current.results[self.results_key()] = (
+                alternatives, criteria, alternatives_scores, totals, weights, order, consistency, notes)
 
             QTimer.singleShot(400, lambda: self.progress_bar.setValue(90))
 
             # Ensure results_card is visible before showing results
             self.results_card.setVisible(True)
             QTimer.singleShot(500, lambda: self.progress_bar.setValue(100))
-            QTimer.singleShot(600, lambda: self.show_results(alternatives, criteria, alternatives_scores, totals, weights))
+            QTimer.singleShot(600, lambda: self.show_results(alternatives, criteria, alternatives_scores, totals, weights, order,
+                                                              consistency, changed_rows))
 
         except Exception as e:
             self.progress_bar.setVisible(False)
             QMessageBox.critical(self, "Error", f"Computation failed: {str(e)}")
 
-    def show_results(self, alternatives, criteria, alternatives_scores, totals, weights):
+    def show_results(self, alternatives, criteria, alternatives_scores, totals, weights, order=None, consistency=None,
+                     changed_rows=None):
         """Display enhanced results with animations and visualizations."""
         try:
             # Prepare the weights display
@@ -727,103 +1232,70 @@ class PhoneAHPWindow(QMainWindow):
             
             self.weights_box.setVisible(True)
             
-            # Prepare the results table
-            self.results_table.setRowCount(len(alternatives))
-            self.results_table.setColumnCount(1 + len(criteria) + 1)
-            self.results_table.setHorizontalHeaderLabels(["Phone"] + criteria + ["Total Score"])
+            # Compare with the previous calculation so only changed rows and cells are repainted
+            alternatives_scores = np.asarray(alternatives_scores, dtype=float)
+            self.stop_rank_animations()
+            previous = self.last_results
+            if previous is not None and previous[0] == alternatives and previous[1] == criteria:
+                diff = diff_rankings(previous[2], previous[3], alternatives_scores, totals,
+                                     order=order, prev_order=previous[4], changed_rows=changed_rows)
+            else:
+                diff = diff_rankings(None, None, alternatives_scores, totals, order=order)
+            self.last_results = (list(alternatives), list(criteria), alternatives_scores, np.asarray(totals), diff.order)
+            
+            if diff.full:
+                # Prepare the results table
+                self.results_table.setRowCount(len(alternatives))
+                self.results_table.setColumnCount(1 + len(criteria) + 1)
+                self.results_table.setHorizontalHeaderLabels(["Phone"] + criteria + ["Total Score"])
 
-            # Sort alternatives by totals (descending)
-            sorted_indices = np.argsort(totals)[::-1]
+            sorted_indices = diff.order
             
-            # Maximum value for each criterion for normalization in visualization
-            max_criterion_values = []
-            for j in range(len(criteria)):
-                max_val = max([alternatives_scores[i][j] for i in range(len(alternatives))])
-                max_criterion_values.append(max_val if max_val > 0 else 1)
-                
-            # Fill table with enhanced visuals
-            for row, idx in enumerate(sorted_indices):
-                # Phone name with rank indicator
-                phone_item = QTableWidgetItem(f"{alternatives[idx]}")
-                if row < 3:  # Top 3 get special treatment
-                    rank_colors = ["#4CAF50", "#26A69A", "#80CBC4"]
-                    phone_item.setFont(QFont("Roboto", 10, QFont.Bold))
-                    phone_item.setForeground(QColor(rank_colors[row]))
-                self.results_table.setItem(row, 0, phone_item)
-                
-                # Individual criterion scores with visual intensity
-                for col, score in enumerate(alternatives_scores[idx], 1):
-                    item = QTableWidgetItem(f"{score:.4f}")
-                    item.setTextAlignment(Qt.AlignCenter)
-                    
-                    # Visual intensity based on normalized score
-                    norm_score = score / max_criterion_values[col-1] if max_criterion_values[col-1] > 0 else 0
-                    
-                    # Create gradient colors based on score importance
-                    if norm_score > 0.8:
-                        item.setBackground(QColor("#C8E6C9"))  # Strong green
-                    elif norm_score > 0.6:
-                        item.setBackground(QColor("#DCEDC8"))  # Medium green
-                    elif norm_score > 0.4:
-                        item.setBackground(QColor("#F1F8E9"))  # Light green
-                    
-                    self.results_table.setItem(row, col, item)
-                
-                # Total score with proper visual highlighting
-                total_item = QTableWidgetItem(f"{totals[idx]:.4f}")
-                total_item.setTextAlignment(Qt.AlignCenter)
-                total_item.setFont(QFont("Roboto", 10, QFont.Bold))
-                
-                # Highlight based on ranking
-                if row == 0:  # Best option
-                    total_item.setBackground(QColor("#4CAF50"))
-                    # total_item.setForeground(QColor("white"))
-                elif row == 1:  # Second best
-                    total_item.setBackground(QColor("#81C784"))
-                    # total_item.setForeground(QColor("white"))
-                elif row == 2:  # Third best
-                    total_item.setBackground(QColor("#A5D6A7"))
-                    
-                self.results_table.setItem(row, len(criteria) + 1, total_item)
+            # Highlight bands are only needed for the phones being repainted
+            painted = np.unique(sorted_indices[np.concatenate([diff.moved_rows, diff.changed_cells[:, 0]]).astype(np.intp)])
+            bands = dict(zip(painted, score_bands(alternatives_scores[painted], diff.col_max)))
+            
+            # Rows that received a different phone are repainted in full
+            for row in diff.moved_rows:
+                idx = sorted_indices[row]
+                self.fill_result_row(row, idx, alternatives, alternatives_scores, totals, bands)
+                if not diff.full and diff.rank_shift[idx] != 0:
+                    self.animate_rank_change(row, alternatives[idx], diff.rank_shift[idx])
+            
+            # Other rows only repaint the cells whose value or highlight changed
+            for row, col in diff.changed_cells:
+                self.fill_result_cell(row, col, sorted_indices[row], alternatives_scores, totals, bands)
             
             # Show visualization of top 3 phones
-            for i in range(min(3, len(sorted_indices))):
+            for i, (name_label, score_label) in enumerate(self.top_positions):
+                if i >= len(sorted_indices):
+                    name_label.setText("TBD")
+                    score_label.setText("0.00")
+                    continue
                 idx = sorted_indices[i]
-                name_label, score_label = self.top_positions[i]
                 name_label.setText(alternatives[idx])
                 score_label.setText(f"Score: {totals[idx]:.4f}")
             
             self.visualization_widget.setVisible(True)
             
             # Show conclusion
-            ideal_phone = alternatives[sorted_indices[0]]
-            second_phone = alternatives[sorted_indices[1]]
-            ideal_score = totals[sorted_indices[0]]
-            second_score = totals[sorted_indices[1]]
-            
-            # Calculate percentage difference between top phones
-            percentage_diff = ((ideal_score - second_score) / second_score) * 100 if second_score > 0 else 0
-            
-            conclusion_text = (
-                f"Based on your criteria preferences, the <b>{ideal_phone}</b> is the optimal choice "
-                f"with an overall score of <b>{ideal_score:.4f}</b>. "
-            )
-            
-            if percentage_diff > 15:
-                conclusion_text += f"It significantly outperforms the {second_phone} by {percentage_diff:.1f}%."
-            elif percentage_diff > 5:
-                conclusion_text += f"It outperforms the {second_phone} by {percentage_diff:.1f}%."
-            else:
-                conclusion_text += f"It slightly edges out the {second_phone} (difference: {percentage_diff:.1f}%)."
-            
+            conclusion_text = build_conclusion(alternatives, totals, sorted_indices)
             self.conclusion_text.setText(conclusion_text)
             self.conclusion_frame.setVisible(True)
             
-            # Animate results appearance
-            self.results_card.setMaximumHeight(0)
-            self.animation.setStartValue(0)
-            self.animation.setEndValue(1000)  # Large enough to show all content
-            self.animation.start()
+            # Everything an export needs, taken from the arrays just displayed
+            self.report = dict(alternatives=list(alternatives), criteria=list(criteria),
+                               alternatives_scores=alternatives_scores, totals=np.asarray(totals),
+                               weights=np.asarray(weights), order=sorted_indices,
+                               consistency=consistency, conclusion=conclusion_text)
+            self.export_btn.setEnabled(True)
+            
+            # Animate results appearance (only when the table was rebuilt)
+            if diff.full:
+                self.results_card.setMaximumHeight(0)
+                self.animation.setStartValue(0)
+                self.animation.setEndValue(1000)  # Large enough to show all content
+                self.animation.start()
             
             self.progress_bar.setVisible(False)
             self.tabs.setCurrentIndex(2)  # Switch to results tab
@@ -831,110 +1303,175 @@ class PhoneAHPWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to display results: {str(e)}")
 
+    def fill_result_row(self, row, idx, alternatives, alternatives_scores, totals, bands):
+        """Paint one full row of the results table."""
+        # Phone name with rank indicator
+        phone_item = QTableWidgetItem(f"{alternatives[idx]}")
+        if row < 3:  # Top 3 get special treatment
+            rank_colors = ["#4CAF50", "#26A69A", "#80CBC4"]
+            phone_item.setFont(QFont("Roboto", 10, QFont.Bold))
+            phone_item.setForeground(QColor(rank_colors[row]))
+        self.results_table.setItem(row, 0, phone_item)
+        
+        for col in range(1, len(alternatives_scores[idx]) + 2):
+            self.fill_result_cell(row, col, idx, alternatives_scores, totals, bands)
+
+    def fill_result_cell(self, row, col, idx, alternatives_scores, totals, bands):
+        """Paint a single score cell (criterion or total) of the results table."""
+        n_crits = len(alternatives_scores[idx])
+        
+        if col <= n_crits:
+            # Individual criterion scores with visual intensity
+            item = QTableWidgetItem(f"{alternatives_scores[idx][col-1]:.4f}")
+            item.setTextAlignment(Qt.AlignCenter)
+            
+            # Create gradient colors based on score importance
+            band = bands[idx][col-1]
+            if band == 3:
+                item.setBackground(QColor("#C8E6C9"))  # Strong green
+            elif band == 2:
+                item.setBackground(QColor("#DCEDC8"))  # Medium green
+            elif band == 1:
+                item.setBackground(QColor("#F1F8E9"))  # Light green
+            
+            self.results_table.setItem(row, col, item)
+            return
+        
+        # Total score with proper visual highlighting
+        total_item = QTableWidgetItem(f"{totals[idx]:.4f}")
+        total_item.setTextAlignment(Qt.AlignCenter)
+        total_item.setFont(QFont("Roboto", 10, QFont.Bold))
+        
+        # Highlight based on ranking
+        if row == 0:  # Best option
+            total_item.setBackground(QColor("#4CAF50"))
+        elif row == 1:  # Second best
+            total_item.setBackground(QColor("#81C784"))
+        elif row == 2:  # Third best
+            total_item.setBackground(QColor("#A5D6A7"))
+            
+        self.results_table.setItem(row, col, total_item)
+
+    def animate_rank_change(self, row, name, shift):
+        """Flash a phone whose rank changed and show how many places it moved."""
+        item = self.results_table.item(row, 0)
+        arrow = "▲" if shift > 0 else "▼"
+        item.setText(f"{name}  {arrow}{abs(shift)}")
+        
+        animation = QVariantAnimation(self)
+        animation.setDuration(1500)
+        animation.setEasingCurve(QEasingCurve.InQuad)
+        animation.setStartValue(QColor("#C8E6C9") if shift > 0 else QColor("#FFCDD2"))
+        animation.setEndValue(QColor(255, 255, 255, 0))
+        animation.valueChanged.connect(item.setBackground)
+        animation.finished.connect(lambda: self.clear_rank_marker(item, name))
+        animation.start()
+        self.rank_animations.append((animation, item, name))
+
+    def clear_rank_marker(self, item, name):
+        """Restore a phone cell after its rank-change animation."""
+        item.setText(name)
+        item.setBackground(QBrush())
+
+    def stop_rank_animations(self):
+        """Finish running rank-change animations before the table is touched again."""
+        for animation, item, name in self.rank_animations:
+            if animation.state() == QVariantAnimation.Running:
+                animation.stop()
+                self.clear_rank_marker(item, name)
+        self.rank_animations = []
+
+    def export_report(self):
+        """Ask for a file and export the displayed results without blocking the window."""
+        if self.report is None or (self.export_worker is not None and self.export_worker.isRunning()):
+            return
+        filters = {"CSV (*.csv)": ".csv", "JSON (*.json)": ".json", "HTML (*.html)": ".html"}
+        path, selected = QFileDialog.getSaveFileName(self, "Export Results", "ahp_results.csv", ";;".join(filters))
+        if not path:
+            return
+        if not path.lower().endswith((".csv", ".json", ".html", ".htm")):
+            path += filters.get(selected, ".csv")
+        
+        self.export_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.export_worker = ExportWorker(path, self.report, self)
+        self.export_worker.progress.connect(self.progress_bar.setValue)
+        self.export_worker.done.connect(self.on_export_done)
+        self.export_worker.failed.connect(self.on_export_failed)
+        self.export_worker.finished.connect(lambda: self.export_btn.setEnabled(self.report is not None))
+        self.export_worker.start()
+
+    def on_export_done(self, path):
+        self.progress_bar.setVisible(False)
+        QMessageBox.information(self, "Export Complete", f"Results exported to {path}")
+
+    def on_export_failed(self, message):
+        self.progress_bar.setVisible(False)
+        QMessageBox.critical(self, "Error", f"Export failed: {message}")
+
+    def closeEvent(self, event):
+        """Stop a running export before the window goes away."""
+        if self.export_worker is not None and self.export_worker.isRunning():
+            self.export_worker.requestInterruption()
+            self.export_worker.wait()
+        super().closeEvent(event)
+
     def reset_inputs(self):
         """Reset all inputs and results."""
+        self.restore_defaults()
+        QMessageBox.information(self, "Reset Complete", "All inputs and results have been reset to default values.")
+
+    def restore_defaults(self):
+        """Put the default dataset back and clear results (tabs not built yet need nothing)."""
         # Reset alternatives and criteria
-        self.alt_input.setText("iPhone 12,Itel A56,Tecno Camon 12,Infinix Hot 10,Huawei P30,Google Pixel 7,Xiaomi Redmi Note 10,Samsung Galaxy S22,Motorola Razr+,iPhone XR,Samsung Galaxy Note 10")
-        self.crit_input.setText("Memory,Storage,CPU Frequency,Price,Brand")
+        self.alt_input.setText(",".join(DEFAULT_ALTERNATIVES))
+        self.crit_input.setText(",".join(DEFAULT_CRITERIA))
+        self.filter_input.clear()
+        self.pareto_checkbox.setChecked(False)
         
         # Reset criteria matrix
-        self.crit_matrix_table.setRowCount(5)
-        self.crit_matrix_table.setColumnCount(5)
-        criteria = ["Memory", "Storage", "CPU Frequency", "Price", "Brand"]
-        self.crit_matrix_table.setHorizontalHeaderLabels(criteria)
-        self.crit_matrix_table.setVerticalHeaderLabels(criteria)
-        crit_matrix_data = [
-            [1, 5, 3, 3, 7],
-            [0.2, 1, 0.333, 0.333, 5],
-            [0.333, 3, 1, 1, 5],
-            [0.333, 3, 1, 1, 5],
-            [0.143, 0.2, 0.2, 0.2, 1]
-        ]
+        self.scenarios.clear()
         
-        for i in range(5):
-            for j in range(5):
-                value = round(crit_matrix_data[i][j], 3)
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                self.crit_matrix_table.setItem(i, j, item)
-                
-                # Color coding based on value intensity
-                if i == j:  # Diagonal is always 1
-                    item.setBackground(QColor("#E0E0E0"))
-                elif value >= 7:
-                    item.setBackground(QColor("#26A69A"))
-                    item.setForeground(QColor("white"))
-                elif value >= 5:
-                    item.setBackground(QColor("#4DB6AC"))
-                elif value >= 3:
-                    item.setBackground(QColor("#80CBC4"))
-                elif value > 1:
-                    item.setBackground(QColor("#B2DFDB"))
-                else:
-                    # Values less than 1 (inverse preferences)
-                    intensity = max(0.2, min(1.0, value * 0.8))
-                    item.setBackground(QColor(f"rgba(224, 224, 224, {intensity})"))
-
-        # Reset specs table
-        memory_specs = [8, 2, 3, 3, 4, 12, 4, 12, 4, 6, 6]
-        storage_specs = [256, 64, 64, 64, 128, 256, 128, 512, 128, 128, 256]
-        cpu_specs = [3.0, 1.5, 1.8, 1.8, 2.0, 3.0, 2.0, 3.2, 2.0, 2.5, 2.8]
-        price_specs = [800, 150, 200, 200, 300, 700, 300, 1000, 400, 600, 900]
-        brand_scores = [8, 1, 2, 2, 7, 8, 5, 10, 5, 7, 9]
-        
-        for i in range(11):
-            # Phone name
-            name_item = QTableWidgetItem(self.alternatives[i])
-            name_item.setFont(QFont("Roboto", 10, QFont.Bold))
-            self.specs_table.setItem(i, 0, name_item)
+        # Reset is itself an undoable step back to the default dataset
+        default = self.default_state
+        current = self.history.current
+        if (not np.array_equal(current.judgments, default.judgments) or current.specs is not default.specs
+                or current.names is not default.names):
+            self.history.push("Reset", default.judgments, default.specs, default.names)
+        self.update_history_buttons()
+        if self.tab_built(1):
+            self.method_combo.setCurrentIndex(0)
+            self.fill_matrix_table()
+            self.scenario_input.clear()
+            self.scenarios_label.setText("No saved scenarios")
+
+        # Reset specs table and results
+        if self.tab_built(2):
+            self.fill_specs_table()
             
-            # Specs with highlighting
-            specs_data = [
-                (memory_specs[i], 1, max(memory_specs)),
-                (storage_specs[i], 2, max(storage_specs)),
-                (cpu_specs[i], 3, max(cpu_specs)),
-                (price_specs[i], 4, min(price_specs)),  # For price, lower is better
-                (brand_scores[i], 5, max(brand_scores))
-            ]
+            self.stop_rank_animations()
+            self.last_results = None
+            self.report = None
+            self.export_btn.setEnabled(False)
+            self.ranking = None
+            self.ranking_rows = None
+            self.results_table.setRowCount(0)
+            self.weights_box.setVisible(False)
+            self.visualization_widget.setVisible(False)
+            self.conclusion_frame.setVisible(False)
+            self.pruned_label.setVisible(False)
+            self.results_card.setVisible(False)
+            self.scenario_card.setVisible(False)
             
-            for value, col, benchmark in specs_data:
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                
-                # Reset cell background
-                is_best = False
-                if col == 4:  # Price - lower is better
-                    is_best = value == benchmark
-                    intensity = 1 - (value - benchmark) / (max(price_specs) - benchmark + 1)
-                else:  # Other specs - higher is better
-                    is_best = value == benchmark
-                    intensity = value / (benchmark + 0.1)
-                
-                # Set background color based on how good the value is
-                if is_best:
-                    item.setBackground(QColor("#B2DFDB"))
-                elif intensity > 0.8:
-                    item.setBackground(QColor("#E0F2F1"))
-                
-                self.specs_table.setItem(i, col, item)
-
-        # Reset results
-        self.results_table.setRowCount(0)
-        self.weights_box.setVisible(False)
-        self.visualization_widget.setVisible(False)
-        self.conclusion_frame.setVisible(False)
-        self.results_card.setVisible(False)
+            # Reset top positions
+            for name_label, score_label in self.top_positions:
+                name_label.setText("TBD")
+                score_label.setText("0.00")
         self.progress_bar.setVisible(False)
         
-        # Reset top positions
-        for name_label, score_label in self.top_positions:
-            name_label.setText("TBD")
-            score_label.setText("0.00")
-        
         # Switch to first tab
         self.tabs.setCurrentIndex(0)
-        
-        QMessageBox.information(self, "Reset Complete", "All inputs and results have been reset to default values.")
 
 def main():
     app = QApplication(sys.argv)
@@ -0,0 +1,84 @@
+import operator
+
+import numpy as np
+import pytest
+
+from ahp_catalog import CatalogIndex, parse_filters
+
+CRITERIA = ["Memory", "Price", "Brand"]
+MAKERS = ["Samsung", "Apple", "Tecno", "Itel"]
+OPERATORS = {"<=": operator.le, "<": operator.lt, ">=": operator.ge, ">": operator.gt, "=": operator.eq}
+
+def brute_force(names, values, conditions):
+    """Rows matching every condition, by checking each row directly."""
+    mask = np.ones(len(names), dtype=bool)
+    for criterion, op, value in conditions:
+        if criterion is None:
+            mask &= np.array([name.split()[0].lower() == value.lower() for name in names], dtype=bool)
+        else:
+            mask &= OPERATORS[op](values[:, CRITERIA.index(criterion)], value)
+    return np.flatnonzero(mask)
+
+def random_conditions(rng):
+    """One to three random conditions; small integer values so ties and boundaries are common."""
+    conditions = []
+    for _ in range(rng.integers(1, 4)):
+        if rng.random() < 0.2:
+            conditions.append((None, "=", str(rng.choice(MAKERS))))
+        else:
+            conditions.append((str(rng.choice(CRITERIA)), str(rng.choice(list(OPERATORS))), float(rng.integers(0, 6))))
+    return conditions
+
+def check(index, names, values, rng):
+    """Compare the index with a fresh rebuild and brute-force queries."""
+    values = np.array(values, dtype=float).reshape(len(names), len(CRITERIA))
+    assert index.names == names
+    np.testing.assert_array_equal(index.values, values)
+    for c in range(len(CRITERIA)):
+        assert np.all(np.diff(index.sorted_values[c]) >= 0)
+        np.testing.assert_array_equal(np.sort(index.order[c]), np.arange(len(names)))
+        np.testing.assert_array_equal(index.values[index.order[c], c], index.sorted_values[c])
+    for _ in range(5):
+        conditions = random_conditions(rng)
+        np.testing.assert_array_equal(index.query(conditions), brute_force(names, values, conditions))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    names = [f"{rng.choice(MAKERS)} {i}" for i in range(20)]
+    values = [list(row) for row in rng.integers(0, 6, (20, len(CRITERIA))).astype(float)]
+    index = CatalogIndex(names, CRITERIA, values)
+    check(index, names, values, rng)
+
+    for step in range(300):
+        action = rng.integers(3)
+        if action == 0 or len(names) < 2:
+            name = f"{rng.choice(MAKERS)} new{step}"
+            row_values = list(rng.integers(0, 6, len(CRITERIA)).astype(float))
+            assert index.add_row(name, row_values) == len(names)
+            names.append(name)
+            values.append(row_values)
+        elif action == 1:
+            row = int(rng.integers(len(names)))
+            index.remove_row(row)
+            del names[row]
+            del values[row]
+        else:
+            row, c = int(rng.integers(len(names))), int(rng.integers(len(CRITERIA)))
+            value = float(rng.integers(0, 6))
+            index.update_value(row, CRITERIA[c], value)
+            values[row][c] = value
+        check(index, names, values, rng)
+
+def test_add_row_to_empty_index():
+    index = CatalogIndex([], CRITERIA, np.empty((0, len(CRITERIA))))
+    index.add_row("Apple 1", [4, 300, 7])
+    index.add_row("Itel 2", [2, 100, 1])
+    np.testing.assert_array_equal(index.query(parse_filters("Price <= 200", CRITERIA)), [1])
+
+def test_parse_filters_brand_score_and_maker():
+    assert parse_filters("Brand >= 7, Brand = Samsung", CRITERIA) == [("Brand", ">=", 7.0), (None, "=", "Samsung")]
+    assert parse_filters("Maker = Apple", CRITERIA) == [(None, "=", "Apple")]
+    for text in ("Memory = Samsung", "Brand > Samsung", "Camera >= 3"):
+        with pytest.raises(ValueError):
+            parse_filters(text, CRITERIA)
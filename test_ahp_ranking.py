@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from ahp_ranking import RankingIndex, rank_order
+
+def check(index, values, weights):
+    """Compare the maintained ranking with a full rescore sorted by rank_order."""
+    values = np.array(values, dtype=float).reshape(-1, len(weights))
+    scores = values * weights
+    totals = np.sum(scores, axis=1)
+    np.testing.assert_array_equal(index.scores, scores)
+    np.testing.assert_array_equal(index.totals, totals)
+    np.testing.assert_array_equal(index.order, rank_order(totals))
+    np.testing.assert_array_equal(index.keys, -totals[index.order])
+    for row in range(len(values)):
+        assert index.rank_of(row) == int(np.flatnonzero(index.order == row)[0])
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_match_rank_order(seed):
+    rng = np.random.default_rng(seed)
+    # Small integer specs and weights make exactly tied totals common
+    weights = rng.integers(1, 4, 3).astype(float)
+    values = [list(row) for row in rng.integers(0, 4, (15, 3)).astype(float)]
+    index = RankingIndex(values, weights)
+    check(index, values, weights)
+
+    for _ in range(300):
+        action = rng.integers(4)
+        if action == 0 or len(values) < 2:
+            row_values = list(rng.integers(0, 4, 3).astype(float))
+            assert index.add_row(row_values) == len(values)
+            values.append(row_values)
+        elif action == 1:
+            row = int(rng.integers(len(values)))
+            index.remove_row(row)
+            del values[row]
+        else:
+            row = int(rng.integers(len(values)))
+            values[row] = list(rng.integers(0, 4, 3).astype(float))
+            old_rank, new_rank = index.update_row(row, values[row])
+            assert new_rank == index.rank_of(row)
+        check(index, values, weights)
+
+def test_snapshot_is_copy_on_write():
+    index = RankingIndex([[1, 2], [3, 4], [2, 2]], [0.5, 0.5])
+    scores, totals, order, changed = index.snapshot()
+    kept = scores.copy(), totals.copy(), order.copy()
+    assert changed == set()
+
+    index.update_row(0, [9, 9])
+    for before, after in zip(kept, (scores, totals, order)):
+        np.testing.assert_array_equal(before, after)
+    assert index.snapshot()[3] == {0}
+    np.testing.assert_array_equal(index.order, [0, 1, 2])